@@ -5,6 +5,9 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable, Iterable
+from typing import Any
+
 
 def load_analyses() -> None:
     """Loading all analyses defined in this package module"""
@@ -17,3 +20,31 @@ def load_analyses() -> None:
     for module_info in pkgutil.iter_modules([str(package_path)]):
         if module_info.ispkg:
             importlib.import_module(f"{__name__}.{module_info.name}")
+
+
+def lazy_main_getattr(package: str, names: Iterable[str]) -> Callable[[str], Any]:
+    """Creating a module __getattr__ importing the analysis implementation main module only when one of its names is
+    accessed, keeping the CLI startup fast.
+
+    Parameters
+    ----------
+    package : str
+        analysis package name, its main submodule is imported on access
+    names : Iterable[str]
+        names exposed by the package and defined in its main submodule
+
+    Returns
+    -------
+    Callable[[str], Any]
+        module level __getattr__ function
+    """
+    lazy_names = frozenset(names)
+
+    def __getattr__(name: str) -> Any:
+        if name in lazy_names:
+            import importlib
+
+            return getattr(importlib.import_module(f"{package}.main"), name)
+        raise AttributeError(f"module {package!r} has no attribute {name!r}")
+
+    return __getattr__
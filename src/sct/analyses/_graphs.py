@@ -0,0 +1,67 @@
+# SPDX-FileCopyrightText: Aresys S.r.l. <info@aresys.it>
+# SPDX-License-Identifier: MIT
+
+"""Graphs rendering utilities shared by the analyses."""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from typing import TypeVar
+
+T = TypeVar("T")
+
+
+@contextmanager
+def rendering_graphs(render_func: Callable[..., T], *iterables: Iterable) -> Iterator[Iterator[T]]:
+    """Rendering independent graphs in separate processes, as pyplot is not thread-safe.
+
+    Rendering starts when entering the context, so that other work can be done while graphs are being rendered, and
+    the context exits once all graphs have been rendered. A single graph is rendered in the calling process.
+
+    The rendering function must be picklable and must not log, as logging is not configured in worker processes:
+    outcomes to be reported should be returned and logged by the caller.
+
+    Parameters
+    ----------
+    render_func : Callable[..., T]
+        graphs rendering function, called with an item of each input iterable as positional arguments
+    *iterables : Iterable
+        rendering function arguments, the shortest iterable sets the number of rendering calls
+
+    Yields
+    ------
+    Iterator[T]
+        rendering function return values, in input order
+    """
+    arguments = list(zip(*iterables, strict=False))
+    if len(arguments) <= 1:
+        yield iter([render_func(*args) for args in arguments])
+        return
+
+    max_workers = min(len(arguments), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_graphs_worker) as executor:
+        yield executor.map(render_func, *zip(*arguments, strict=True))
+
+
+def render_graphs(render_func: Callable[..., T], *iterables: Iterable) -> list[T]:
+    """Rendering independent graphs in separate processes, waiting for all of them to be rendered.
+
+    See rendering_graphs for parameters description.
+
+    Returns
+    -------
+    list[T]
+        rendering function return values, in input order
+    """
+    with rendering_graphs(render_func, *iterables) as outcomes:
+        return list(outcomes)
+
+
+def _init_graphs_worker() -> None:
+    """Initializer of graphs rendering workers, selecting the non-interactive matplotlib backend."""
+    import matplotlib
+
+    matplotlib.use("Agg")
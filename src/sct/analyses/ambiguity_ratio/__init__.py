@@ -5,9 +5,9 @@
 
 from __future__ import annotations
 
+from sct.analyses import lazy_main_getattr
 from sct.analyses.ambiguity_ratio.cli import ptar_analysis
 from sct.analyses.ambiguity_ratio.config import SCTTargetAmbiguityRatioConfig
-from sct.analyses.ambiguity_ratio.main import full_pt_ambiguity_ratio_analysis
 from sct.core.base import AnalysisHandler
 from sct.core.registry import register_analysis
 
@@ -20,4 +20,7 @@ register_analysis(
     handler=AnalysisHandler(config=SCTTargetAmbiguityRatioConfig, cli=ptar_analysis, testing=None),
 )
 
+
 __all__ = ["full_pt_ambiguity_ratio_analysis"]
+
+__getattr__ = lazy_main_getattr(__name__, __all__)
@@ -5,9 +5,9 @@
 
 from __future__ import annotations
 
+from sct.analyses import lazy_main_getattr
 from sct.analyses.elevation_notch.cli import notch_analysis
 from sct.analyses.elevation_notch.config import SCTElevationNotchAnalysisConfig
-from sct.analyses.elevation_notch.main import full_elevation_notch_analysis
 from sct.analyses.elevation_notch.testing import (
     run_notch_api,
     run_notch_cli,
@@ -32,4 +32,7 @@ register_analysis(
     ),
 )
 
+
 __all__ = ["full_elevation_notch_analysis"]
+
+__getattr__ = lazy_main_getattr(__name__, __all__)
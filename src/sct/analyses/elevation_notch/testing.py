@@ -11,7 +11,6 @@ import numpy as np
 from netCDF4 import Dataset
 
 from sct.analyses.elevation_notch.config import SCTElevationNotchAnalysisConfig
-from sct.analyses.elevation_notch.main import full_elevation_notch_analysis
 from sct.testing.utilities.common import ReferenceOutput, TestOutput, TestParams, cli_launcher
 
 ABSOLUTE_TOLERANCE = 1e-5
@@ -38,6 +37,8 @@ def run_notch_api(
     TestOutput
         path to output netcdf file
     """
+    from sct.analyses.elevation_notch.main import full_elevation_notch_analysis
+
     nc_output = full_elevation_notch_analysis(
         product=params.product,
         antenna_pattern=params.antenna_pattern,
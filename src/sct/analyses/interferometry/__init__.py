@@ -5,9 +5,9 @@
 
 from __future__ import annotations
 
+from sct.analyses import lazy_main_getattr
 from sct.analyses.interferometry.cli import interf_coherence_analysis
 from sct.analyses.interferometry.config import SCTInterferometricAnalysisConfig
-from sct.analyses.interferometry.main import full_interferometric_analysis
 from sct.analyses.interferometry.testing import (
     run_interf_api,
     run_interf_cli,
@@ -32,4 +32,7 @@ register_analysis(
     ),
 )
 
+
 __all__ = ["full_interferometric_analysis"]
+
+__getattr__ = lazy_main_getattr(__name__, __all__)
@@ -6,14 +6,21 @@
 from __future__ import annotations
 
 from collections.abc import Callable
+from itertools import repeat
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from perseo_quality.interferometric_analysis.support import coherence_histograms_to_netcdf
 
+from sct.analyses._graphs import render_graphs
 from sct.analyses.interferometry.config import SCTInterferometricAnalysisConfig
 from sct.analyses.interferometry.core import sct_interferometric_coherence_analysis
 from sct.configuration.logger import sct_logger
 
+if TYPE_CHECKING:
+    from perseo_quality.interferometric_analysis.config import InterferometricConfig
+    from perseo_quality.interferometric_analysis.custom_dataclasses import InterferometricCoherenceOutput
+
 
 def full_interferometric_analysis(
     product: Path,
@@ -50,21 +57,15 @@ def full_interferometric_analysis(
     )
     netcdf_file = coherence_histograms_to_netcdf(data=coherence_res, output_dir=output_directory)
 
-    if graphs_func is not None:
+    if graphs_func is not None and coherence_res:
         sct_logger.info("Generating graphs...")
-        for res in coherence_res:
-            graphs_func(
-                data=res,
-                output_dir=output_directory,
-                mode="magnitude",
-                config=config.base_config,
-            )
-            graphs_func(
-                data=res,
-                output_dir=output_directory,
-                mode="phase",
-                config=config.base_config,
-            )
+        render_graphs(
+            _render_interf_graphs,
+            repeat(graphs_func),
+            coherence_res,
+            repeat(output_directory),
+            repeat(config.base_config),
+        )
     return netcdf_file
 
 
@@ -80,3 +81,26 @@ def _import_interf_graphs_func(graphs: bool) -> Callable | None:
             )
             raise ImportError from err
     return generate_coherence_graphs
+
+
+def _render_interf_graphs(
+    graphs_func: Callable,
+    data: InterferometricCoherenceOutput,
+    output_directory: Path,
+    config: InterferometricConfig,
+) -> None:
+    """Rendering the coherence magnitude and phase graphs of a single channel.
+
+    Parameters
+    ----------
+    graphs_func : Callable
+        interferometric coherence graphs plotting function
+    data : InterferometricCoherenceOutput
+        interferometric coherence output of the channel
+    output_directory : Path
+        Path to the output directory
+    config : InterferometricConfig
+        interferometric analysis base configuration
+    """
+    graphs_func(data=data, output_dir=output_directory, mode="magnitude", config=config)
+    graphs_func(data=data, output_dir=output_directory, mode="phase", config=config)
@@ -11,13 +11,30 @@ import numpy as np
 from netCDF4 import Dataset
 
 from sct.analyses.interferometry.config import SCTInterferometricAnalysisConfig
-from sct.analyses.interferometry.main import full_interferometric_analysis
 from sct.testing.utilities.common import ReferenceOutput, TestOutput, TestParams, cli_launcher
 
 ABSOLUTE_TOLERANCE = 1e-5
 ABSOLUTE_TOLERANCE_INTERF = 5
 
 
+def _split_products(product: Path | list[Path]) -> tuple[Path, Path | None]:
+    """Splitting the test input products into the first product and the optional second one.
+
+    Parameters
+    ----------
+    product : Path | list[Path]
+        single product or list of products
+
+    Returns
+    -------
+    tuple[Path, Path | None]
+        first product, second product if provided else None
+    """
+    if isinstance(product, Path):
+        return product, None
+    return product[0], product[1] if len(product) > 1 else None
+
+
 def run_interf_api(
     params: TestParams, output_dir: Path, config: SCTInterferometricAnalysisConfig | None, graphs: bool
 ) -> TestOutput:
@@ -39,9 +56,13 @@ def run_interf_api(
     TestOutput
         path to output netcdf file
     """
+    from sct.analyses.interferometry.main import full_interferometric_analysis
+
+    first_prod, second_prod = _split_products(params.product)
+
     nc_output = full_interferometric_analysis(
-        product=params.product if isinstance(params.product, Path) else params.product[0],
-        product_2=params.product[1] if isinstance(params.product, list) else None,
+        product=first_prod,
+        product_2=second_prod,
         config=config,
         output_directory=output_dir,
         graphs=graphs,
@@ -77,8 +98,7 @@ def run_interf_cli(params: TestParams, output_dir: Path, config: Path | None, gr
     RuntimeError
         if missing output NetCDF files
     """
-    first_prod = params.product if isinstance(params.product, Path) else params.product[0]
-    second_prod = params.product[1] if isinstance(params.product, list) else None
+    first_prod, second_prod = _split_products(params.product)
     cli_args = []
     if config is not None:
         cli_args.extend(["--config", config])
@@ -125,39 +145,37 @@ def validate_interf_results(current_output: TestOutput, reference_output: Refere
         reference output
     """
 
-    current_dataset = Dataset(current_output.netcdf_results, "r", format="NETCDF4")
-    ref_dataset = Dataset(reference_output.netcdf_reference, "r", format="NETCDF4")
-
-    assert ref_dataset.groups.keys() == current_dataset.groups.keys()
-    for key, group in ref_dataset.groups.items():
-        current_group = current_dataset.groups[key]
-        assert group.groups.keys() == current_group.groups.keys()
-        for p_key, subgroup in group.groups.items():
-            current_subgroup = current_group.groups[p_key]
-            assert subgroup.swath == current_subgroup.swath
-            assert subgroup.channel == current_subgroup.channel
-            assert subgroup.polarization == current_subgroup.polarization
-            for burst, burst_group in subgroup.groups.items():
-                current_burst_group = current_subgroup.groups[burst]
-
-                np.testing.assert_allclose(
-                    burst_group["coherence_bins"][:],
-                    current_burst_group["coherence_bins"][:],
-                    atol=ABSOLUTE_TOLERANCE,
-                    rtol=0,
-                )
-                np.testing.assert_allclose(
-                    burst_group["azimuth_histogram"][:],
-                    current_burst_group["azimuth_histogram"][:],
-                    atol=ABSOLUTE_TOLERANCE_INTERF,
-                    rtol=0,
-                )
-                np.testing.assert_allclose(
-                    burst_group["range_histogram"][:],
-                    current_burst_group["range_histogram"][:],
-                    atol=ABSOLUTE_TOLERANCE_INTERF,
-                    rtol=0,
-                )
-
-    ref_dataset.close()
-    current_dataset.close()
+    with (
+        Dataset(current_output.netcdf_results, "r", format="NETCDF4") as current_dataset,
+        Dataset(reference_output.netcdf_reference, "r", format="NETCDF4") as ref_dataset,
+    ):
+        assert ref_dataset.groups.keys() == current_dataset.groups.keys()
+        for key, group in ref_dataset.groups.items():
+            current_group = current_dataset.groups[key]
+            assert group.groups.keys() == current_group.groups.keys()
+            for p_key, subgroup in group.groups.items():
+                current_subgroup = current_group.groups[p_key]
+                assert subgroup.swath == current_subgroup.swath
+                assert subgroup.channel == current_subgroup.channel
+                assert subgroup.polarization == current_subgroup.polarization
+                for burst, burst_group in subgroup.groups.items():
+                    current_burst_group = current_subgroup.groups[burst]
+
+                    np.testing.assert_allclose(
+                        burst_group["coherence_bins"][:],
+                        current_burst_group["coherence_bins"][:],
+                        atol=ABSOLUTE_TOLERANCE,
+                        rtol=0,
+                    )
+                    np.testing.assert_allclose(
+                        burst_group["azimuth_histogram"][:],
+                        current_burst_group["azimuth_histogram"][:],
+                        atol=ABSOLUTE_TOLERANCE_INTERF,
+                        rtol=0,
+                    )
+                    np.testing.assert_allclose(
+                        burst_group["range_histogram"][:],
+                        current_burst_group["range_histogram"][:],
+                        atol=ABSOLUTE_TOLERANCE_INTERF,
+                        rtol=0,
+                    )
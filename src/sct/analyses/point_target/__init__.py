@@ -5,9 +5,9 @@
 
 from __future__ import annotations
 
+from sct.analyses import lazy_main_getattr
 from sct.analyses.point_target.cli import target_analysis
 from sct.analyses.point_target.config import SCTPointTargetAnalysisConfig
-from sct.analyses.point_target.main import full_point_target_analysis
 from sct.analyses.point_target.testing import run_pta_api, run_pta_cli, validate_pta_results
 from sct.core.base import AnalysisHandler, AnalysisTestingHandler
 from sct.core.registry import register_analysis
@@ -28,4 +28,7 @@ register_analysis(
     ),
 )
 
-__all__ = ["full_point_target_analysis"]
+
+__all__ = ["full_point_target_analysis", "point_target_analysis_with_results"]
+
+__getattr__ = lazy_main_getattr(__name__, __all__)
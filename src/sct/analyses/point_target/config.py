@@ -5,21 +5,43 @@
 
 from __future__ import annotations
 
-from dataclasses import asdict, dataclass, field, fields
+from collections.abc import Callable
+from dataclasses import asdict, dataclass, field
+from enum import Enum
+from functools import cache
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from perseo_perturbations.atmospheric.ionosphere import (
-    IonosphericAnalysisCenters,
-    TECIncidenceAngleMethod,
-)
-from perseo_perturbations.atmospheric.troposphere import TroposphericGRIDResolution
 from perseo_quality.point_targets_analysis.config import PointTargetAnalysisConfig
 
 from sct.analyses.point_target.resources import config_schema
-from sct.configuration.common import InvalidConfigurationFile
+from sct.configuration.common import InvalidConfigurationFile, dataclass_field_names
 from sct.configuration.config_abc import AnalysisConfigABC
 
+if TYPE_CHECKING:
+    from perseo_perturbations.atmospheric.ionosphere import IonosphericAnalysisCenters, TECIncidenceAngleMethod
+    from perseo_perturbations.atmospheric.troposphere import TroposphericGRIDResolution
+
+
+@cache
+def _members_by_lowercase_name(enum_class: type[Enum]) -> dict[str, Enum]:
+    """Case-insensitive lookup of the enum members set from configuration files, by lowercase name."""
+    return {m.name.lower(): m for m in enum_class}
+
+
+# default factories importing atmospheric perturbations enums only when corrections are configured, as their modules
+# are expensive to import and configurations are loaded at every CLI startup
+def _default_tec_incidence_angle_method() -> TECIncidenceAngleMethod:
+    from perseo_perturbations.atmospheric.ionosphere import TECIncidenceAngleMethod
+
+    return TECIncidenceAngleMethod.GROUND_CONVERTED
+
+
+def _default_map_grid_resolution() -> TroposphericGRIDResolution:
+    from perseo_perturbations.atmospheric.troposphere import TroposphericGRIDResolution
+
+    return TroposphericGRIDResolution.FINE
+
 
 @dataclass
 class IonosphericCorrectionsConf:
@@ -27,30 +49,33 @@ class IonosphericCorrectionsConf:
 
     maps_directory: Path
     analysis_center: IonosphericAnalysisCenters
-    tec_incidence_angle_method: TECIncidenceAngleMethod = TECIncidenceAngleMethod.GROUND_CONVERTED
+    tec_incidence_angle_method: TECIncidenceAngleMethod = field(default_factory=_default_tec_incidence_angle_method)
 
     @classmethod
     def from_dict(cls, arg: dict) -> IonosphericCorrectionsConf:
         """Convert from dict"""
-        valid_fields = set(f.name for f in fields(cls))
+        valid_fields = dataclass_field_names(cls)
         required_fields = set(("maps_directory",))
 
-        unrecognized_keys = set(arg.keys()) - valid_fields
-        missing_keys = required_fields - set(arg.keys())
+        unrecognized_keys = arg.keys() - valid_fields
+        missing_keys = required_fields - arg.keys()
 
         if unrecognized_keys:
             raise InvalidConfigurationFile(f"IonosphericCorrectionsConf: {unrecognized_keys} not supported")
         if missing_keys:
             raise InvalidConfigurationFile(f"IonosphericCorrectionsConf: {missing_keys} are required")
 
+        from perseo_perturbations.atmospheric.ionosphere import IonosphericAnalysisCenters, TECIncidenceAngleMethod
+
         out = cls(
             maps_directory=Path(arg["maps_directory"]),
-            analysis_center=IonosphericAnalysisCenters[arg["analysis_center"].upper()],
+            analysis_center=_members_by_lowercase_name(IonosphericAnalysisCenters)[arg["analysis_center"].lower()],
         )
 
-        for key, value in arg.items():
-            if key == "tec_incidence_angle_method":
-                out.tec_incidence_angle_method = TECIncidenceAngleMethod[value.upper()]
+        if "tec_incidence_angle_method" in arg:
+            out.tec_incidence_angle_method = _members_by_lowercase_name(TECIncidenceAngleMethod)[
+                arg["tec_incidence_angle_method"].lower()
+            ]
 
         return out
 
@@ -68,16 +93,16 @@ class TroposphericCorrectionsConf:
     """SCT Point Target Analysis tropospheric corrections configuration"""
 
     maps_directory: Path
-    map_grid_resolution: TroposphericGRIDResolution = TroposphericGRIDResolution.FINE
+    map_grid_resolution: TroposphericGRIDResolution = field(default_factory=_default_map_grid_resolution)
 
     @classmethod
     def from_dict(cls, arg: dict) -> TroposphericCorrectionsConf:
         """Convert from dict"""
         required_fields = set(("maps_directory",))
-        valid_fields = set(f.name for f in fields(cls))
+        valid_fields = dataclass_field_names(cls)
 
-        unrecognized_keys = set(arg.keys()) - valid_fields
-        missing_keys = required_fields - set(arg.keys())
+        unrecognized_keys = arg.keys() - valid_fields
+        missing_keys = required_fields - arg.keys()
 
         if unrecognized_keys:
             raise InvalidConfigurationFile(f"TroposphericCorrectionsConf: {unrecognized_keys} not supported")
@@ -86,7 +111,11 @@ class TroposphericCorrectionsConf:
 
         out = cls(maps_directory=Path(arg["maps_directory"]))
         if "map_grid_resolution" in arg:
-            out.map_grid_resolution = TroposphericGRIDResolution[arg["map_grid_resolution"].upper()]
+            from perseo_perturbations.atmospheric.troposphere import TroposphericGRIDResolution
+
+            out.map_grid_resolution = _members_by_lowercase_name(TroposphericGRIDResolution)[
+                arg["map_grid_resolution"].lower()
+            ]
 
         return out
 
@@ -114,18 +143,14 @@ class SCTPointTargetAnalysisCorrectionsConf:
     def from_dict(cls, arg: dict) -> SCTPointTargetAnalysisCorrectionsConf:
         """Convert from dict"""
         out = cls()
-        valid_fields = [f.name for f in fields(out)]
+        valid_fields = dataclass_field_names(cls)
 
         for key, value in arg.items():
             if key not in valid_fields:
                 raise InvalidConfigurationFile(f"SCTPointTargetAnalysisCorrectionsConfig: {key} not supported")
 
-            if key == "ionosphere":
-                out.ionosphere = IonosphericCorrectionsConf.from_dict(value)
-            elif key == "troposphere":
-                out.troposphere = TroposphericCorrectionsConf.from_dict(value)
-            else:
-                setattr(out, key, value)
+            converter = _CORRECTIONS_SUB_CONFIGS.get(key)
+            setattr(out, key, value if converter is None else converter(value))
 
         return out
 
@@ -141,6 +166,31 @@ class SCTPointTargetAnalysisCorrectionsConf:
         return out
 
 
+# point target analysis flags saved to SCT configuration files
+_BASE_CONFIG_DUMPED_FLAGS = (
+    "perform_irf",
+    "perform_rcs",
+    "evaluate_pslr",
+    "evaluate_islr",
+    "evaluate_sslr",
+    "evaluate_localization",
+)
+
+# corrections nested configurations converters, by field name
+_CORRECTIONS_SUB_CONFIGS: dict[str, Callable[[dict], Any]] = {
+    "ionosphere": IonosphericCorrectionsConf.from_dict,
+    "troposphere": TroposphericCorrectionsConf.from_dict,
+}
+
+
+@cache
+def _point_target_analysis_fields() -> frozenset[str]:
+    """Supported fields of the point target analysis configuration, with SCT configuration conventions."""
+    return frozenset(("corrections", "ale_validity_limits", "advanced_configuration")).union(
+        dataclass_field_names(PointTargetAnalysisConfig)
+    )
+
+
 @dataclass
 class SCTPointTargetAnalysisConfig(AnalysisConfigABC):
     """SCT Point Target Analysis configuration"""
@@ -154,8 +204,7 @@ class SCTPointTargetAnalysisConfig(AnalysisConfigABC):
     def from_dict(cls, arg: dict) -> SCTPointTargetAnalysisConfig:
         """Convert from dict"""
         out = cls()
-        valid_fields: set[str] = set(("corrections", "ale_validity_limits", "advanced_configuration"))
-        valid_fields.update(f.name for f in fields(PointTargetAnalysisConfig))
+        valid_fields = _point_target_analysis_fields()
 
         for key in arg:
             if key not in valid_fields:
@@ -176,25 +225,13 @@ class SCTPointTargetAnalysisConfig(AnalysisConfigABC):
     @staticmethod
     def base_config_to_dict(base_config: PointTargetAnalysisConfig) -> dict:
         """Convert base config to dict with SCT configuration conventions."""
-        config = asdict(base_config)
-
-        pta_ale = config.pop("ale_limits")
-        pta_irf = config.pop("irf_parameters")
+        # only the dumped nested parameters are converted to dict, the other fields are read directly
+        pta_irf = asdict(base_config.irf_parameters)
         if pta_irf["masking_method"] is not None:
             pta_irf["masking_method"] = pta_irf["masking_method"].name.lower()
-        pta_rcs = config.pop("rcs_parameters")
-        config: dict[str, Any] = dict(
-            (k, config[k])
-            for k in (
-                "perform_irf",
-                "perform_rcs",
-                "evaluate_pslr",
-                "evaluate_islr",
-                "evaluate_sslr",
-                "evaluate_localization",
-            )
-        )
-        config["ale_validity_limits"] = pta_ale
+        pta_rcs = asdict(base_config.rcs_parameters)
+        config: dict[str, Any] = {k: getattr(base_config, k) for k in _BASE_CONFIG_DUMPED_FLAGS}
+        config["ale_validity_limits"] = base_config.ale_limits
         config["advanced_configuration"] = {}
         config["advanced_configuration"]["irf_parameters"] = pta_irf
         config["advanced_configuration"]["rcs_parameters"] = pta_rcs
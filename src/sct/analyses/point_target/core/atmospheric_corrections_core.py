@@ -15,7 +15,7 @@ from perseo_core.timing import PreciseDateTime
 from perseo_perturbations.atmospheric import ionosphere, troposphere
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class IonosphericInput:
     """Input for ionospheric delay computation"""
 
@@ -29,7 +29,7 @@ class IonosphericInput:
     """path to ionospheric maps directory"""
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TroposphereInput:
     """Input for tropospheric delay computation"""
 
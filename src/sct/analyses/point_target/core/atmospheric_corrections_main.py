@@ -21,7 +21,7 @@ from sct.analyses.point_target.core.atmospheric_corrections_core import (
 from sct.configuration.logger import sct_logger
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class AtmosphericDelaysAcquisitionInfo:
     """Acquisition information required for computing atmospheric delays"""
 
@@ -93,16 +93,15 @@ def convert_atmospheric_delays_to_df(
     pd.DataFrame
         dataframe of atmospheric delays for each point target
     """
-    df = target_names.to_frame()
-    if delays[0] is not None:
-        df["ionospheric_delay_range_correction_[m]"] = delays[0]
-    else:
-        df["ionospheric_delay_range_correction_[m]"] = np.nan
-    if delays[1] is not None:
-        df["tropospheric_delay_hydrostatic_range_correction_[m]"] = delays[1][0]
-        df["tropospheric_delay_wet_range_correction_[m]"] = delays[1][1]
-    else:
-        df["tropospheric_delay_hydrostatic_range_correction_[m]"] = np.nan
-        df["tropospheric_delay_wet_range_correction_[m]"] = np.nan
-
-    return df
+    ionospheric_delay, tropospheric_delay = delays
+    hydrostatic_delay, wet_delay = tropospheric_delay if tropospheric_delay is not None else (np.nan, np.nan)
+    # building the dataframe from columns at once, missing delays are broadcast to NaN
+    return pd.DataFrame(
+        {
+            target_names.name: target_names,
+            "ionospheric_delay_range_correction_[m]": ionospheric_delay if ionospheric_delay is not None else np.nan,
+            "tropospheric_delay_hydrostatic_range_correction_[m]": hydrostatic_delay,
+            "tropospheric_delay_wet_range_correction_[m]": wet_delay,
+        },
+        index=target_names.index,
+    )
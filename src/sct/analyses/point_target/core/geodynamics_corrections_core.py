@@ -16,7 +16,7 @@ from sct.configuration.logger import sct_logger
 SECONDS_IN_A_YEAR = 3.154e7
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SolidTidesInput:
     """Inputs to compute solid tides displacement"""
 
@@ -24,7 +24,7 @@ class SolidTidesInput:
     """acquisition time at which compute the displacement"""
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PlateTectonicsInput:
     """Inputs to compute plate tectonics displacement"""
 
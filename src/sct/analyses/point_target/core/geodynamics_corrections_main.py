@@ -16,6 +16,8 @@ from sct.analyses.point_target.core.geodynamics_corrections_core import (
 )
 from sct.configuration.logger import sct_logger
 
+VALIDITY_DATES_COLUMNS = ["validity_start_date", "validity_stop_date", "measurement_date"]
+
 
 def run_compute_geodynamics_corrections(
     nominal_target_coords: np.ndarray,
@@ -28,12 +30,20 @@ def run_compute_geodynamics_corrections(
     plate_tectonics_input = None
     if enable_plate_tectonics_correction:
         try:
-            # checking if acquisition time lies within point target data time validity boundaries
-            def _to_pdt(date: pd.Series) -> PreciseDateTime:
-                return PreciseDateTime.fromisoformat(date.mode()[0].isoformat())
+            # most frequent value of each date column, computed in a single pass
+            dates = point_targets_df[VALIDITY_DATES_COLUMNS].mode()
+            if dates.empty or dates.iloc[0].isna().any():
+                raise KeyError("Missing time validity dates")
 
-            date_lower_boundary = _to_pdt(point_targets_df["validity_start_date"])
-            date_upper_boundary = _to_pdt(point_targets_df["validity_stop_date"])
+            def _to_pdt(date) -> PreciseDateTime:
+                # point targets readers already provide PreciseDateTime dates, other datetime-like values are converted
+                if isinstance(date, PreciseDateTime):
+                    return date
+                return PreciseDateTime.fromisoformat(date.isoformat())
+
+            # checking if acquisition time lies within point target data time validity boundaries
+            date_lower_boundary = _to_pdt(dates.at[0, "validity_start_date"])
+            date_upper_boundary = _to_pdt(dates.at[0, "validity_stop_date"])
 
             if not date_lower_boundary <= acquisition_time <= date_upper_boundary:
                 raise RuntimeError(
@@ -42,7 +52,7 @@ def run_compute_geodynamics_corrections(
                 )
 
             # computing time delta between acquisition time and calibration site measurement campaign date
-            time_delta_s = acquisition_time - _to_pdt(point_targets_df["measurement_date"])
+            time_delta_s = acquisition_time - _to_pdt(dates.at[0, "measurement_date"])
 
         except KeyError as err:
             sct_logger.critical("Missing time validity required information in input point targets")
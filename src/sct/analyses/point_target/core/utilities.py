@@ -9,12 +9,10 @@ from typing import TYPE_CHECKING
 
 import numpy as np
 import pandas as pd
+from perseo_core.geometry.coordinates import xyz2llh
 from perseo_core.geometry.navigation import Trajectory
 from perseo_quality.core.signal_processing import convert_to_db
-from perseo_quality.point_targets_analysis.rcs_geometric_computation import (
-    compute_elevation_azimuth_wrt_enu,
-    compute_rcs_trihedral_corner_reflector,
-)
+from perseo_quality.point_targets_analysis.rcs_geometric_computation import compute_rcs_trihedral_corner_reflector
 from scipy.constants import speed_of_light
 
 from sct.analyses.point_target.config import SCTPointTargetAnalysisConfig
@@ -35,6 +33,8 @@ if TYPE_CHECKING:
 AZIMUTH_BORE_CR = np.pi / 4
 ELEV_BORE_CR = np.deg2rad(35.2644)
 
+TARGET_COORDS_COLUMNS = ["x_coord_m", "y_coord_m", "z_coord_m"]
+
 
 PTA_SCT_ADDITIONAL_OUTPUT_FIELDS = {
     "total_doppler": "total_doppler_frequency_[Hz]",
@@ -48,16 +48,49 @@ PTA_SCT_ADDITIONAL_OUTPUT_FIELDS = {
 }
 
 
+def _compute_elevation_azimuth_wrt_enu(pos_cr: np.ndarray, pos_sat: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Vectorized version of compute_elevation_azimuth_wrt_enu, computing the elevation and azimuth angles at which
+    several targets see the corresponding satellite positions, with respect to their local ENU reference frames.
+
+    Parameters
+    ----------
+    pos_cr : np.ndarray
+        3D Cartesian positions of the targets, with shape (N, 3)
+    pos_sat : np.ndarray
+        3D Cartesian positions of the satellite observing each target, with shape (N, 3)
+
+    Returns
+    -------
+    np.ndarray
+        elevation angles in radians in the targets ENU local reference frames, with shape (N,)
+    np.ndarray
+        azimuth angles in radians in the targets ENU local reference frames, with shape (N,)
+    """
+    llh = xyz2llh(pos_cr).reshape(-1, 3)
+    cos_lat, sin_lat = np.cos(llh[:, 0]), np.sin(llh[:, 0])
+    cos_lon, sin_lon = np.cos(llh[:, 1]), np.sin(llh[:, 1])
+
+    los = pos_sat - pos_cr
+    los = los / np.linalg.norm(los, axis=1, keepdims=True)
+
+    # line of sight projections on east, north and up axes
+    los_e = -sin_lon * los[:, 0] + cos_lon * los[:, 1]
+    los_n = -cos_lon * sin_lat * los[:, 0] - sin_lon * sin_lat * los[:, 1] + cos_lat * los[:, 2]
+    los_u = cos_lon * cos_lat * los[:, 0] + sin_lon * cos_lat * los[:, 1] + sin_lat * los[:, 2]
+
+    return np.arcsin(los_u), np.arctan2(los_e, los_n)
+
+
 # TODO: should this be here? move to PERSEO maybe?
 def _compute_theoretical_rcs_core(
     sensor_position: np.ndarray,
     target_position: np.ndarray,
-    elev_bore_enu: float,
-    azimuth_bore_enu: float,
-    cr_arm_length: float,
+    elev_bore_enu: np.ndarray,
+    azimuth_bore_enu: np.ndarray,
+    cr_arm_length: np.ndarray,
     carrier_frequency_hz: float,
-):
-    elev_los_enu, azimuth_los_enu = compute_elevation_azimuth_wrt_enu(
+) -> np.ndarray:
+    elev_los_enu, azimuth_los_enu = _compute_elevation_azimuth_wrt_enu(
         pos_cr=target_position,
         pos_sat=sensor_position,
     )
@@ -69,19 +102,18 @@ def _compute_theoretical_rcs_core(
     # compute CR RCS
     # if the radio wave does not impinge on the front of the CR, the RCS computation is not valid
     is_angle_range_valid = (
-        azimuth_los_cr >= 0 and azimuth_los_cr <= np.pi / 2 and elev_los_cr >= 0 and elev_los_cr <= np.pi / 2
+        (azimuth_los_cr >= 0) & (azimuth_los_cr <= np.pi / 2) & (elev_los_cr >= 0) & (elev_los_cr <= np.pi / 2)
     )
-    if not is_angle_range_valid:
-        return np.nan
-
-    return convert_to_db(
+    rcs = np.full(is_angle_range_valid.shape, np.nan)
+    rcs[is_angle_range_valid] = convert_to_db(
         compute_rcs_trihedral_corner_reflector(
-            cr_arm_length,
+            cr_arm_length[is_angle_range_valid],
             speed_of_light / carrier_frequency_hz,
-            elev_los_cr,
-            azimuth_los_cr,
+            elev_los_cr[is_angle_range_valid],
+            azimuth_los_cr[is_angle_range_valid],
         ),
     )
+    return rcs
 
 
 def _compute_theoretical_rcs(
@@ -111,34 +143,42 @@ def _compute_theoretical_rcs(
     list
         List of theoretical RCS values
     """
-    results = []
-    for _, row in data_df.iterrows():
-        curr_point_target = point_targets_df[point_targets_df["target_name"] == row["target_name"]]
-
-        cr_arm_length = curr_point_target["target_size_m"].iloc[0]
-
-        # orientation of boresight in ENU
-        elev_bore_enu = np.deg2rad(curr_point_target["corner_elevation_deg"].iloc[0])
-        azimuth_bore_enu = np.deg2rad(curr_point_target["corner_azimuth_deg"].iloc[0])
-
-        try:
-            sensor_position_at_zd = trajectory.position(row["peak_azimuth_time_[UTC]"])
-            cr_position = curr_point_target[["x_coord_m", "y_coord_m", "z_coord_m"]].to_numpy().squeeze()
-
-            cr_rcs_m2 = _compute_theoretical_rcs_core(
-                sensor_position=sensor_position_at_zd,
-                target_position=cr_position,
-                elev_bore_enu=elev_bore_enu,
-                azimuth_bore_enu=azimuth_bore_enu,
-                cr_arm_length=cr_arm_length,
-                carrier_frequency_hz=carrier_frequency_hz,
-            )
-
-            results.append(cr_rcs_m2)
-        except TypeError:
-            results.append(np.nan)
+    # boresight orientation in ENU is converted once per target, before being joined to each result of that target
+    targets_geometry = point_targets_df[
+        ["target_name", "target_size_m", "corner_elevation_deg", "corner_azimuth_deg"] + TARGET_COORDS_COLUMNS
+    ].drop_duplicates("target_name")
+    targets_geometry = targets_geometry.assign(
+        elev_bore_enu_rad=np.deg2rad(targets_geometry["corner_elevation_deg"].to_numpy(dtype=float)),
+        azimuth_bore_enu_rad=np.deg2rad(targets_geometry["corner_azimuth_deg"].to_numpy(dtype=float)),
+    )
+    # joining each result to the info of the corresponding target, all targets quantities are then processed as arrays
+    targets_info = data_df[["target_name", "peak_azimuth_time_[UTC]"]].merge(
+        targets_geometry, on="target_name", how="left"
+    )
+    results = np.full(len(targets_info), np.nan)
+
+    # results without a peak azimuth time cannot be evaluated
+    is_time_valid = targets_info["peak_azimuth_time_[UTC]"].notna().to_numpy()
+    if not is_time_valid.any():
+        return results.tolist()
+    targets_info = targets_info.iloc[is_time_valid]
+
+    # evaluating the trajectory only once for results sharing the same peak azimuth time
+    peak_times = targets_info["peak_azimuth_time_[UTC]"].to_numpy()
+    _, first_index, inverse = np.unique(
+        (peak_times - peak_times[0]).astype(float), return_index=True, return_inverse=True
+    )
+    sensor_positions = np.asarray(trajectory.position(peak_times[first_index]), dtype=float).reshape(-1, 3)
+    results[is_time_valid] = _compute_theoretical_rcs_core(
+        sensor_position=sensor_positions[inverse.ravel()],
+        target_position=targets_info[TARGET_COORDS_COLUMNS].to_numpy(dtype=float),
+        elev_bore_enu=targets_info["elev_bore_enu_rad"].to_numpy(),
+        azimuth_bore_enu=targets_info["azimuth_bore_enu_rad"].to_numpy(),
+        cr_arm_length=targets_info["target_size_m"].to_numpy(dtype=float),
+        carrier_frequency_hz=carrier_frequency_hz,
+    )
 
-    return results
+    return results.tolist()
 
 
 def update_targets_with_geodynamics_corrections(
@@ -188,13 +228,19 @@ def update_results_with_derived_quantities(results: pd.DataFrame) -> pd.DataFram
     pd.DataFrame
         point target analysis results to be updated
     """
-    # sum all corrections along a specific direction
-    results[PTA_SCT_ADDITIONAL_OUTPUT_FIELDS["total_rng_ale_corr"]] = results[
-        [c for c in results.columns if "_range_correction_[m]" in c]
-    ].sum(axis=1)
-    results[PTA_SCT_ADDITIONAL_OUTPUT_FIELDS["total_az_ale_corr"]] = results[
-        [c for c in results.columns if "_azimuth_correction_[m]" in c]
-    ].sum(axis=1)
+    # sum all corrections along a specific direction, splitting corrections columns by direction in a single pass
+    range_corrections, azimuth_corrections = [], []
+    for column in results.columns:
+        if "_range_correction_[m]" in column:
+            range_corrections.append(column)
+        elif "_azimuth_correction_[m]" in column:
+            azimuth_corrections.append(column)
+    results[PTA_SCT_ADDITIONAL_OUTPUT_FIELDS["total_rng_ale_corr"]] = np.nansum(
+        results[range_corrections].to_numpy(dtype=float), axis=1
+    )
+    results[PTA_SCT_ADDITIONAL_OUTPUT_FIELDS["total_az_ale_corr"]] = np.nansum(
+        results[azimuth_corrections].to_numpy(dtype=float), axis=1
+    )
 
     # compute corrected ALE measurement
     results[PTA_SCT_ADDITIONAL_OUTPUT_FIELDS["revised_rng_ale"]] = (
@@ -245,7 +291,7 @@ def update_results_with_atmospheric_corrections(
         config=config.corrections,
     )
     atmospheric_delays_df = convert_atmospheric_delays_to_df(
-        target_names=point_targets_df["target_name"].copy(),
+        target_names=point_targets_df["target_name"],
         delays=atmospheric_delays,
     )
 
@@ -274,9 +320,10 @@ def update_results_with_theoretical_rcs(
     theoretical_rcs = None
     if theoretical_rcs_information_is_available:
         sct_logger.info("Computing theoretical RCS...")
+        # input dataframes are only read, no defensive copy is needed
         theoretical_rcs = _compute_theoretical_rcs(
-            data_df=results.copy(),
-            point_targets_df=point_targets_df.copy(),
+            data_df=results,
+            point_targets_df=point_targets_df,
             carrier_frequency_hz=first_channel.carrier_frequency,
             trajectory=first_channel.trajectory,
         )
@@ -329,9 +376,8 @@ def update_df_with_llh(
     pd.DataFrame
         updated point target analysis results
     """
-    general_info_df = results.loc[:, :"acquisition_mode"].copy()
-    pt_coords_df = point_targets_df.loc[:, :"altitude_m"].copy()
-    merged = general_info_df.merge(pt_coords_df, on=["target_name"])
-    addition = results.loc[:, "acquisition_mode":].copy()
-    addition.drop("acquisition_mode", axis=1, inplace=True)
-    return pd.concat([merged, addition], axis=1)
+    # looking up the coordinates of each result target, aligned to the results rows
+    pt_coords_df = point_targets_df.loc[:, :"altitude_m"].drop_duplicates("target_name").set_index("target_name")
+    llh_df = pt_coords_df.reindex(results["target_name"]).set_axis(results.index)
+    split = results.columns.get_loc("acquisition_mode") + 1
+    return pd.concat([results.iloc[:, :split], llh_df, results.iloc[:, split:]], axis=1)
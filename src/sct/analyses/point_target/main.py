@@ -5,13 +5,22 @@
 
 from __future__ import annotations
 
+import traceback
 from collections.abc import Callable
+from itertools import repeat
 from pathlib import Path
+from typing import TYPE_CHECKING
 
+import pandas as pd
+
+from sct.analyses._graphs import render_graphs
 from sct.analyses.point_target.config import SCTPointTargetAnalysisConfig
 from sct.analyses.point_target.core import sct_point_target_analysis_with_corrections
 from sct.configuration.logger import sct_logger
 
+if TYPE_CHECKING:
+    from perseo_quality.point_targets_analysis.custom_dataclasses import PointTargetGraphicalData
+
 
 def full_point_target_analysis(
     product: Path,
@@ -46,6 +55,53 @@ def full_point_target_analysis(
     Path
         Path to the CSV file containing the point target analysis results
     """
+    results_filename, _ = point_target_analysis_with_results(
+        product=product,
+        point_target_source=point_target_source,
+        output_directory=output_directory,
+        external_orbit=external_orbit,
+        external_corrections_product=external_corrections_product,
+        config=config,
+        graphs=graphs,
+    )
+    return results_filename
+
+
+def point_target_analysis_with_results(
+    product: Path,
+    point_target_source: Path,
+    output_directory: Path,
+    external_orbit: Path | None,
+    external_corrections_product: Path | None,
+    config: SCTPointTargetAnalysisConfig | None,
+    graphs: bool,
+) -> tuple[Path, pd.DataFrame]:
+    """Point Target Analysis execution, saving results to disk and returning them also as in-memory dataframe.
+
+    Parameters
+    ----------
+    product : Path
+        Path to the product to be analyzed
+    point_target_source : Path
+        Path to the point target source file
+    output_directory : Path
+        Path to the output directory
+    external_orbit : Path | None
+        Path to the external orbit file, if any
+    external_corrections_product : Path | None
+        Path to the external corrections product, if any
+    config : SCTPointTargetAnalysisConfig | None
+        analysis configuration parameters, if needed
+    graphs : bool
+        flag to enable graphs generation
+
+    Returns
+    -------
+    Path
+        Path to the CSV file containing the point target analysis results
+    pd.DataFrame
+        point target analysis results
+    """
     graphs_func = _import_pta_graphs_func(graphs)
     results, graphs_data = sct_point_target_analysis_with_corrections(
         product_path=product,
@@ -61,7 +117,7 @@ def full_point_target_analysis(
         graphs_out_dir = output_directory.joinpath("graphs")
         graphs_out_dir.mkdir(exist_ok=True)
         graphs_func(graphs_data=graphs_data, results_df=results, output_dir=graphs_out_dir)
-    return results_filename
+    return results_filename, results
 
 
 def _import_pta_graphs_func(graphs: bool) -> Callable | None:
@@ -69,10 +125,86 @@ def _import_pta_graphs_func(graphs: bool) -> Callable | None:
     point_target_graphs_generation = None
     if graphs:
         try:
-            from perseo_quality.point_targets_analysis.graphical_output import point_target_graphs_generation
+            import perseo_quality.point_targets_analysis.graphical_output  # noqa: F401
         except ImportError as err:
             sct_logger.critical(
                 'Cannot generate graphical output: install graphs requirements "pip install sct[graphs]"'
             )
             raise ImportError from err
+        point_target_graphs_generation = _point_target_graphs_generation
     return point_target_graphs_generation
+
+
+def _point_target_graphs_generation(
+    graphs_data: list[PointTargetGraphicalData], results_df: pd.DataFrame, output_dir: Path
+) -> None:
+    """Point Target Analysis output graphs generation, rendering graphs of different targets in parallel processes.
+
+    Parameters
+    ----------
+    graphs_data : list[PointTargetGraphicalData]
+        graphs data for plotting results
+    results_df : pd.DataFrame
+        point target analysis results dataframe
+    output_dir : Path
+        path to output directory where to save the graphs
+    """
+    # results records indexed by graphs identifiers, keeping the first occurrence of each key
+    key_columns = ["target_name", "channel", "burst", "swath", "polarization"]
+    records_lookup = {}
+    for record in results_df.to_dict("records"):
+        records_lookup.setdefault(tuple(record[col] for col in key_columns), record)
+
+    items, data_values = [], []
+    for item in graphs_data:
+        record = records_lookup.get((item.target, item.channel, item.burst, item.swath, item.polarization.value))
+        if record is None:
+            sct_logger.warning(f"Could not create graph for {item.channel}, target {item.target}: results not found")
+            continue
+        items.append(item)
+        data_values.append(record)
+    if not items:
+        return
+
+    failures = render_graphs(_render_point_target_graphs, items, data_values, repeat(output_dir))
+
+    # rendering errors are logged here, as logging is not configured in the worker processes
+    for item, failure in zip(items, failures, strict=True):
+        if failure is not None:
+            sct_logger.warning(f"Could not create graph for {item.channel}, target {item.target} ...")
+            sct_logger.debug(failure)
+
+
+def _render_point_target_graphs(item: PointTargetGraphicalData, data_values: dict, output_dir: Path) -> str | None:
+    """Rendering IRF and RCS graphs of a single point target.
+
+    Parameters
+    ----------
+    item : PointTargetGraphicalData
+        graphs data of the point target
+    data_values : dict
+        point target analysis results record of the point target
+    output_dir : Path
+        path to output directory where to save the graphs
+
+    Returns
+    -------
+    str | None
+        formatted traceback of the rendering error, None if graphs have been successfully created
+    """
+    from perseo_quality.point_targets_analysis.custom_dataclasses import PTAGraphsInfo
+    from perseo_quality.point_targets_analysis.graphical_output import irf_graphs, rcs_graphs
+
+    graphs_info = PTAGraphsInfo(
+        channel=str(item.channel),
+        polarization=item.polarization.name,
+        swath=item.swath,
+        target=str(item.target),
+        burst=str(item.burst),
+    )
+    try:
+        irf_graphs(data_graph=item.irf, data_values=data_values, graphs_info=graphs_info, out_dir=output_dir)
+        rcs_graphs(data_graph=item.rcs, graphs_info=graphs_info, out_dir=output_dir)
+    except Exception:
+        return traceback.format_exc()
+    return None
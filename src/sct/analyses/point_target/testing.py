@@ -5,8 +5,10 @@
 
 from __future__ import annotations
 
+from dataclasses import replace
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 
 from sct.analyses.point_target.config import (
@@ -14,7 +16,6 @@ from sct.analyses.point_target.config import (
     SCTPointTargetAnalysisConfig,
     TroposphericCorrectionsConf,
 )
-from sct.analyses.point_target.main import full_point_target_analysis
 from sct.testing.utilities.common import ReferenceOutput, TestOutput, TestParams, cli_launcher
 
 ABSOLUTE_TOLERANCE = 1e-5
@@ -72,18 +73,31 @@ def run_pta_api(
     Returns
     -------
     TestOutput
-        Path to the saved output .csv file
+        Path to the saved output .csv file and the in-memory results
     """
+    from sct.analyses.point_target.main import point_target_analysis_with_results
+
+    # the input configuration is customized on a copy, leaving the already parsed instance untouched
+    corrections = config.corrections
     if params.ionospheric_maps is not None:
-        config.corrections.enable_ionospheric_correction = True
-        config.corrections.ionosphere = IonosphericCorrectionsConf(
-            maps_directory=params.ionospheric_maps,
-            analysis_center=config.corrections.ionosphere.analysis_center,
+        corrections = replace(
+            corrections,
+            enable_ionospheric_correction=True,
+            ionosphere=IonosphericCorrectionsConf(
+                maps_directory=params.ionospheric_maps,
+                analysis_center=corrections.ionosphere.analysis_center,
+            ),
         )
     if params.tropospheric_maps is not None:
-        config.corrections.enable_tropospheric_correction = True
-        config.corrections.troposphere = TroposphericCorrectionsConf(maps_directory=params.tropospheric_maps)
-    output_csv = full_point_target_analysis(
+        corrections = replace(
+            corrections,
+            enable_tropospheric_correction=True,
+            troposphere=TroposphericCorrectionsConf(maps_directory=params.tropospheric_maps),
+        )
+    if corrections is not config.corrections:
+        config = replace(config, corrections=corrections)
+
+    output_csv, results = point_target_analysis_with_results(
         product=params.product,
         external_orbit=params.external_orbit,
         external_corrections_product=params.external_corrections_product,
@@ -92,7 +106,7 @@ def run_pta_api(
         config=config,
         graphs=graphs,
     )
-    return TestOutput(csv_results=output_csv)
+    return TestOutput(csv_results=output_csv, dataframe_results=results)
 
 
 def run_pta_cli(params: TestParams, output_dir: Path, config: Path | None, graphs: bool) -> TestOutput:
@@ -167,62 +181,113 @@ def validate_pta_results(current_output: TestOutput, reference_output: Reference
     reference_output : ReferenceOutput
         reference output
     """
-    current = pd.read_csv(current_output.csv_results)
     ref = pd.read_csv(reference_output.csv_reference)
+    if current_output.dataframe_results is not None:
+        current = current_output.dataframe_results
+        if current_output.csv_results is not None:
+            _check_written_results(results=current, csv_results=current_output.csv_results)
+        current = _align_to_reference_types(results=current, ref=ref)
+    else:
+        current = pd.read_csv(current_output.csv_results)
 
-    # filtering only valid rows
-    current = current.loc[~current["incidence_angle_[deg]"].isna()]
-    current.reset_index(drop=True, inplace=True)
-    ref = ref.loc[~ref["incidence_angle_[deg]"].isna()]
-    ref.reset_index(drop=True, inplace=True)
+    if ref.equals(current):
+        # identical results are always within tolerances
+        return
+
+    # filtering only valid rows, original indexes are kept so that rows are matched also by their position in file
+    current = current.iloc[current["incidence_angle_[deg]"].notna().to_numpy()]
+    ref = ref.iloc[ref["incidence_angle_[deg]"].notna().to_numpy()]
 
     # splitting dataframes to check different values with specific tolerances
     loc_var_list = LOC_VAR_LIST
     if set(ADDITIONAL_LOC_VAR_LIST).issubset(current.columns):
         loc_var_list = LOC_VAR_LIST + ADDITIONAL_LOC_VAR_LIST
-    loc_df_ref = ref[loc_var_list].copy()
-    loc_report = current[loc_var_list].copy()
-    pd.testing.assert_frame_equal(loc_df_ref, loc_report, check_exact=False, atol=ABSOLUTE_TOLERANCE_LOC, rtol=0)
-
-    deg_df_ref = ref[DEG_VAR_LIST].copy()
-    deg_report = current[DEG_VAR_LIST].copy()
-    pd.testing.assert_frame_equal(deg_df_ref, deg_report, check_exact=False, atol=ABSOLUTE_TOLERANCE_DEG, rtol=0)
-
-    islr_df_ref = ref[SLR_VAR_LIST].copy()
-    islr_report = current[SLR_VAR_LIST].copy()
-    pd.testing.assert_frame_equal(
-        islr_df_ref,
-        islr_report,
-        check_exact=False,
-        atol=ABSOLUTE_TOLERANCE_SLR,
-        rtol=0,
-    )
+    numeric_var_list = loc_var_list + DEG_VAR_LIST + SLR_VAR_LIST + RCS_VAR_LIST + OTHER_VAR_LIST
 
-    rcs_df_ref = ref[RCS_VAR_LIST].copy()
-    rcs_report = current[RCS_VAR_LIST].copy()
-    pd.testing.assert_frame_equal(rcs_df_ref, rcs_report, check_exact=False, atol=ABSOLUTE_TOLERANCE_RCS, rtol=0)
+    # compared columns are cast to float64 upfront, so that numerical comparison never falls back to object arrays
+    numeric_dtypes = dict.fromkeys(numeric_var_list, np.float64)
+    ref = ref.astype(numeric_dtypes)
+    current = current.astype(numeric_dtypes)
 
-    other_df_ref = ref[OTHER_VAR_LIST].copy()
-    other_report = current[OTHER_VAR_LIST].copy()
-    pd.testing.assert_frame_equal(
-        other_df_ref,
-        other_report,
-        check_exact=False,
-        atol=ABSOLUTE_TOLERANCE_OTHER,
-        rtol=0,
-    )
+    _assert_columns_close(ref, current, columns=loc_var_list, atol=ABSOLUTE_TOLERANCE_LOC)
+    _assert_columns_close(ref, current, columns=DEG_VAR_LIST, atol=ABSOLUTE_TOLERANCE_DEG)
+    _assert_columns_close(ref, current, columns=SLR_VAR_LIST, atol=ABSOLUTE_TOLERANCE_SLR)
+    _assert_columns_close(ref, current, columns=RCS_VAR_LIST, atol=ABSOLUTE_TOLERANCE_RCS)
+    _assert_columns_close(ref, current, columns=OTHER_VAR_LIST, atol=ABSOLUTE_TOLERANCE_OTHER)
 
     # checking goodness of results
     pd.testing.assert_frame_equal(
-        ref.drop(
-            loc_var_list + DEG_VAR_LIST + SLR_VAR_LIST + RCS_VAR_LIST + OTHER_VAR_LIST + AZ_TIME_VAR,
-            axis=1,
-        ),
-        current.drop(
-            loc_var_list + DEG_VAR_LIST + SLR_VAR_LIST + RCS_VAR_LIST + OTHER_VAR_LIST + AZ_TIME_VAR,
-            axis=1,
-        ),
+        ref.drop(numeric_var_list + AZ_TIME_VAR, axis=1),
+        current.drop(numeric_var_list + AZ_TIME_VAR, axis=1),
         check_exact=False,
         atol=ABSOLUTE_TOLERANCE,
         rtol=0,
     )
+
+
+def _check_written_results(results: pd.DataFrame, csv_results: Path) -> None:
+    """Checking that the results file on disk matches the in-memory results in header and number of rows.
+
+    Parameters
+    ----------
+    results : pd.DataFrame
+        in-memory results dataframe
+    csv_results : Path
+        path to the results .csv file written by the analysis
+    """
+    header = pd.read_csv(csv_results, nrows=0).columns.tolist()
+    assert header == results.columns.tolist(), f"Results file {csv_results} header does not match the results"
+    # rows are counted as lines without parsing the file again, the header line excluded
+    with open(csv_results, "rb") as f_in:
+        rows_num = sum(1 for _ in f_in) - 1
+    assert rows_num == len(results), f"Results file {csv_results} has {rows_num} rows, {len(results)} expected"
+
+
+def _align_to_reference_types(results: pd.DataFrame, ref: pd.DataFrame) -> pd.DataFrame:
+    """Aligning in-memory results to the types inferred when reading the reference from file.
+
+    Parameters
+    ----------
+    results : pd.DataFrame
+        in-memory results dataframe
+    ref : pd.DataFrame
+        reference dataframe
+
+    Returns
+    -------
+    pd.DataFrame
+        results with columns cast to the reference types
+    """
+    columns = {}
+    for col, dtype in ref.dtypes.items():
+        if col not in results.columns or col in AZ_TIME_VAR:
+            continue
+        try:
+            columns[col] = results[col].astype(dtype)
+        except (TypeError, ValueError) as err:
+            raise AssertionError(f"Column {col} cannot be compared with the reference {dtype} values: {err}") from err
+    return results.assign(**columns)
+
+
+def _assert_columns_close(ref: pd.DataFrame, current: pd.DataFrame, columns: list[str], atol: float) -> None:
+    """Checking that the selected numerical columns of two dataframes are equal within the given absolute tolerance.
+
+    Values are compared directly on the underlying numpy arrays, the detailed pandas comparison is performed only
+    in case of failure to provide a meaningful report of the mismatching column.
+
+    Parameters
+    ----------
+    ref : pd.DataFrame
+        reference dataframe
+    current : pd.DataFrame
+        current dataframe
+    columns : list[str]
+        names of the columns to be compared
+    atol : float
+        absolute tolerance
+    """
+    try:
+        np.testing.assert_allclose(current[columns].to_numpy(), ref[columns].to_numpy(), rtol=0, atol=atol)
+    except AssertionError:
+        pd.testing.assert_frame_equal(ref[columns], current[columns], check_exact=False, atol=atol, rtol=0)
+        raise
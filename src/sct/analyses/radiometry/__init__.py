@@ -5,13 +5,9 @@
 
 from __future__ import annotations
 
+from sct.analyses import lazy_main_getattr
 from sct.analyses.radiometry.cli import radiometric_app
 from sct.analyses.radiometry.config import SCTRadiometricAnalysisConfig
-from sct.analyses.radiometry.main import (
-    full_average_elevation_profiles_analysis,
-    full_nesz_analysis,
-    full_scalloping_analysis,
-)
 from sct.analyses.radiometry.testing import (
     run_nesz_api,
     run_nesz_cli,
@@ -65,8 +61,11 @@ register_analysis(
     handler=AnalysisHandler(config=SCTRadiometricAnalysisConfig, cli=radiometric_app, testing=None),
 )
 
+
 __all__ = [
     "full_nesz_analysis",
     "full_average_elevation_profiles_analysis",
     "full_scalloping_analysis",
 ]
+
+__getattr__ = lazy_main_getattr(__name__, __all__)
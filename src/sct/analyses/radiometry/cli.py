@@ -17,6 +17,25 @@ from sct.configuration.logger import sct_logger
 
 radiometric_app = typer.Typer(help="Block-wise Radiometric Analysis.")
 
+# output radiometric quantities by command line option value
+RADIOMETRIC_QUANTITIES = {
+    "beta": SARRadiometricQuantity.BETA_NOUGHT,
+    "gamma": SARRadiometricQuantity.GAMMA_NOUGHT,
+    "sigma": SARRadiometricQuantity.SIGMA_NOUGHT,
+}
+
+
+def _log_path(config: GeneralConfiguration, output_directory: Path) -> Path | None:
+    """Radiometric analysis log file path, None if saving the log is disabled."""
+    return output_directory / "sct_ra_analysis.log" if config.save_log else None
+
+
+def _load_analysis_config(config: GeneralConfiguration) -> SCTRadiometricAnalysisConfig:
+    """Loading the radiometric analysis configuration from the input toml file, if any, else the default one."""
+    if config.toml_path is not None:
+        return SCTRadiometricAnalysisConfig.from_toml(config.toml_path)
+    return SCTRadiometricAnalysisConfig()
+
 
 @radiometric_app.command("nesz")
 def radiometric_analysis_nesz(
@@ -29,20 +48,14 @@ def radiometric_analysis_nesz(
 
     config: GeneralConfiguration = ctx.obj
 
-    log_path = output_directory / "sct_ra_analysis.log" if config.save_log else None
-
-    with common.logging_to_file(log_path):
+    with common.logging_to_file(_log_path(config, output_directory)):
         sct_logger.info(f"Product: {product}")
         sct_logger.info(f"Output folder is: {output_directory}")
         sct_logger.info(f"Graphs generation {'enabled' if graphs else 'disabled'}")
 
         common.display_title("NESZ   Analysis")
 
-        analysis_config = (
-            SCTRadiometricAnalysisConfig.from_toml(config.toml_path)
-            if config.toml_path is not None
-            else SCTRadiometricAnalysisConfig()
-        )
+        analysis_config = _load_analysis_config(config)
         radiometric_analysis_nesz_implementation(
             product=product,
             output_directory=output_directory,
@@ -62,13 +75,11 @@ def radiometric_analysis_average_profiles(
 ) -> None:
     """Average Elevation Profiles radiometric analysis."""
 
-    output_radiometric_quantity = SARRadiometricQuantity[output_radiometric_quantity.upper() + "_NOUGHT"]
+    output_radiometric_quantity = RADIOMETRIC_QUANTITIES[output_radiometric_quantity]
 
     config: GeneralConfiguration = ctx.obj
 
-    log_path = output_directory / "sct_ra_analysis.log" if config.save_log else None
-
-    with common.logging_to_file(log_path):
+    with common.logging_to_file(_log_path(config, output_directory)):
         sct_logger.info(f"Product: {product}")
         sct_logger.info(f"Output radiometric quantity is: {output_radiometric_quantity.name}")
         sct_logger.info(f"Output folder is: {output_directory}")
@@ -76,11 +87,7 @@ def radiometric_analysis_average_profiles(
 
         common.display_title("Radiometric  Analysis")
 
-        analysis_config = (
-            SCTRadiometricAnalysisConfig.from_toml(config.toml_path)
-            if config.toml_path is not None
-            else SCTRadiometricAnalysisConfig()
-        )
+        analysis_config = _load_analysis_config(config)
         radiometric_analysis_average_profiles_implementation(
             product=product,
             output_radiometric_quantity=output_radiometric_quantity,
@@ -119,20 +126,14 @@ def radiometric_analysis_scalloping(
 
     config: GeneralConfiguration = ctx.obj
 
-    log_path = output_directory / "sct_ra_analysis.log" if config.save_log else None
-
-    with common.logging_to_file(log_path):
+    with common.logging_to_file(_log_path(config, output_directory)):
         sct_logger.info(f"Product: {product}")
         sct_logger.info(f"Output folder is: {output_directory}")
         sct_logger.info(f"Graphs generation {'enabled' if graphs else 'disabled'}")
 
         common.display_title("Scalloping   Profiles")
 
-        analysis_config = (
-            SCTRadiometricAnalysisConfig.from_toml(config.toml_path)
-            if config.toml_path is not None
-            else SCTRadiometricAnalysisConfig()
-        )
+        analysis_config = _load_analysis_config(config)
         radiometric_analysis_scalloping_implementation(
             product=product,
             output_directory=output_directory,
@@ -4,9 +4,15 @@
 """Radiometric Analysis - Core implementation"""
 
 from sct.analyses.radiometry.core.analysis import (
+    load_radiometric_product,
     sct_average_elevation_profile_analysis,
     sct_nesz_analysis,
     sct_scalloping_analysis,
 )
 
-__all__ = ["sct_nesz_analysis", "sct_average_elevation_profile_analysis", "sct_scalloping_analysis"]
+__all__ = [
+    "load_radiometric_product",
+    "sct_nesz_analysis",
+    "sct_average_elevation_profile_analysis",
+    "sct_scalloping_analysis",
+]
@@ -5,6 +5,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
 from enum import Enum
 from pathlib import Path
 
@@ -19,6 +20,7 @@ from perseo_quality.radiometric_analysis.custom_dataclasses import RadiometricPr
 
 from sct.analyses.radiometry.config import SCTRadiometricAnalysisConfig
 from sct.configuration.logger import sct_logger
+from sct.io.extended_protocols import SCTInputProduct
 from sct.io.io_manager import InvalidProductType, product_loader
 
 
@@ -30,11 +32,48 @@ class SupportedRadiometricProfiles(Enum):
     SCALLOPING = "scalloping"
 
 
+# radiometric profiles functions by analysis type, average profiles are handled separately as they also require the
+# output radiometric quantity
+_RADIOMETRIC_PROFILES_DISPATCH: dict[SupportedRadiometricProfiles, Callable[..., list[RadiometricProfilesOutput]]] = {
+    SupportedRadiometricProfiles.NESZ: nesz_profiles,
+    SupportedRadiometricProfiles.SCALLOPING: scalloping_profiles,
+}
+
+
+def load_radiometric_product(product_path: str | Path) -> SCTInputProduct:
+    """Loading the input product to be analyzed with the radiometric profiles analyses.
+
+    Parameters
+    ----------
+    product_path : str | Path
+        path to the product to be analyzed
+
+    Returns
+    -------
+    SCTInputProduct
+        loaded input product
+
+    Raises
+    ------
+    InvalidProductType
+        if no installed plugin can read the product
+    """
+    product_path = Path(product_path)
+    try:
+        product, _ = product_loader(product_path=product_path)
+    except InvalidProductType as err:
+        sct_logger.critical(f"Unknown product type {product_path}.")
+        sct_logger.critical("Please check that the dedicated format plugin is installed.")
+        raise InvalidProductType from err
+    return product
+
+
 def sct_radiometric_profiles(
     product_path: str | Path,
     analysis_type: SupportedRadiometricProfiles,
     config: RadiometricProfilesConfig,
     output_quantity: SARRadiometricQuantity | None = None,
+    product: SCTInputProduct | None = None,
 ) -> list[RadiometricProfilesOutput]:
     """Radiometric profiles SCT wrapper.
 
@@ -48,6 +87,9 @@ def sct_radiometric_profiles(
         radiometric profiles configuration
     output_quantity : SARRadiometricQuantity | None, optional
         output SAR radiometric quantity, by default None
+    product : SCTInputProduct | None, optional
+        already loaded product, to avoid loading it again when performing several analyses on the same product,
+        by default None
 
     Returns
     -------
@@ -55,28 +97,19 @@ def sct_radiometric_profiles(
         list of RadiometricProfilesOutput results dataclass, one for each channel
     """
 
-    product_path = Path(product_path)
-
     # LOADING PRODUCT
-    try:
-        product, _ = product_loader(product_path=product_path)
-    except InvalidProductType as err:
-        sct_logger.critical(f"Unknown product type {product_path}.")
-        sct_logger.critical("Please check that the dedicated format plugin is installed.")
-        raise InvalidProductType from err
+    if product is None:
+        product = load_radiometric_product(product_path=product_path)
 
-    if analysis_type == SupportedRadiometricProfiles.NESZ:
-        results = nesz_profiles(product=product, config=config)
-    elif analysis_type == SupportedRadiometricProfiles.PROFILES:
-        results = average_elevation_profiles(product=product, output_quantity=output_quantity, config=config)
-    elif analysis_type == SupportedRadiometricProfiles.SCALLOPING:
-        results = scalloping_profiles(product=product, config=config)
-
-    return results
+    if analysis_type == SupportedRadiometricProfiles.PROFILES:
+        return average_elevation_profiles(product=product, output_quantity=output_quantity, config=config)
+    return _RADIOMETRIC_PROFILES_DISPATCH[analysis_type](product=product, config=config)
 
 
 def sct_nesz_analysis(
-    product_path: str | Path, config: SCTRadiometricAnalysisConfig | None = None
+    product_path: str | Path,
+    config: SCTRadiometricAnalysisConfig | None = None,
+    product: SCTInputProduct | None = None,
 ) -> list[RadiometricProfilesOutput]:
     """SCT Noise Equivalent Sigma-Zero (NESZ) radiometric block-wise analysis.
 
@@ -86,6 +119,8 @@ def sct_nesz_analysis(
         path to the product to be analyzed
     config : SCTRadiometricAnalysisConfig | None, optional
         SCT radiometric analysis configuration, by default None
+    product : SCTInputProduct | None, optional
+        already loaded product, if available, by default None
 
     Returns
     -------
@@ -99,7 +134,10 @@ def sct_nesz_analysis(
         config = SCTRadiometricAnalysisConfig()
 
     return sct_radiometric_profiles(
-        product_path=product_path, analysis_type=SupportedRadiometricProfiles.NESZ, config=config.base_config
+        product_path=product_path,
+        analysis_type=SupportedRadiometricProfiles.NESZ,
+        config=config.base_config,
+        product=product,
     )
 
 
@@ -107,6 +145,7 @@ def sct_average_elevation_profile_analysis(
     product_path: str | Path,
     output_quantity: SARRadiometricQuantity,
     config: SCTRadiometricAnalysisConfig | None = None,
+    product: SCTInputProduct | None = None,
 ) -> list[RadiometricProfilesOutput]:
     """SCT Average Radiometric Elevation Profile block-wise analysis.
 
@@ -118,6 +157,8 @@ def sct_average_elevation_profile_analysis(
         output SAR radiometric quantity
     config : SCTRadiometricAnalysisConfig | None, optional
         SCT radiometric analysis configuration, by default None
+    product : SCTInputProduct | None, optional
+        already loaded product, if available, by default None
 
     Returns
     -------
@@ -135,11 +176,14 @@ def sct_average_elevation_profile_analysis(
         output_quantity=output_quantity,
         analysis_type=SupportedRadiometricProfiles.PROFILES,
         config=config.base_config,
+        product=product,
     )
 
 
 def sct_scalloping_analysis(
-    product_path: str | Path, config: SCTRadiometricAnalysisConfig | None = None
+    product_path: str | Path,
+    config: SCTRadiometricAnalysisConfig | None = None,
+    product: SCTInputProduct | None = None,
 ) -> list[RadiometricProfilesOutput]:
     """SCT Scalloping radiometric block-wise analysis.
 
@@ -149,6 +193,8 @@ def sct_scalloping_analysis(
         path to the product to be analyzed
     config : SCTRadiometricAnalysisConfig | None, optional
         SCT radiometric analysis configuration, by default None
+    product : SCTInputProduct | None, optional
+        already loaded product, if available, by default None
 
     Returns
     -------
@@ -162,5 +208,8 @@ def sct_scalloping_analysis(
         config = SCTRadiometricAnalysisConfig()
 
     return sct_radiometric_profiles(
-        product_path=product_path, analysis_type=SupportedRadiometricProfiles.SCALLOPING, config=config.base_config
+        product_path=product_path,
+        analysis_type=SupportedRadiometricProfiles.SCALLOPING,
+        config=config.base_config,
+        product=product,
     )
@@ -6,6 +6,8 @@
 from __future__ import annotations
 
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from itertools import repeat
 from pathlib import Path
 
 from perseo_quality.core.generic_dataclasses import SARRadiometricQuantity
@@ -15,13 +17,16 @@ from perseo_quality.radiometric_analysis.block_wise.support import (
 )
 from perseo_quality.radiometric_analysis.custom_dataclasses import RadiometricProfilesOutput
 
+from sct.analyses._graphs import rendering_graphs
 from sct.analyses.radiometry.config import SCTRadiometricAnalysisConfig
 from sct.analyses.radiometry.core import (
+    load_radiometric_product,
     sct_average_elevation_profile_analysis,
     sct_nesz_analysis,
     sct_scalloping_analysis,
 )
 from sct.configuration.logger import sct_logger
+from sct.io.extended_protocols import SCTInputProduct
 
 
 def full_nesz_analysis(
@@ -50,10 +55,11 @@ def full_nesz_analysis(
     Path
         Path to the CSV file containing the radiometric statistics
     """
-    graphs_func = _import_ra_graphs_func(graphs)
+    input_product, graphs_func = _prefetch_product_and_graphs_func(product=product, graphs=graphs)
     output = sct_nesz_analysis(
         product_path=product,
         config=config,
+        product=input_product,
     )
     return _ra_save_and_plot_results(
         output=output, output_directory=output_directory, graphs_func=graphs_func, tag="NESZ", plot_mode="min"
@@ -89,11 +95,12 @@ def full_average_elevation_profiles_analysis(
     Path
         Path to the CSV file containing the radiometric statistics
     """
-    graphs_func = _import_ra_graphs_func(graphs)
+    input_product, graphs_func = _prefetch_product_and_graphs_func(product=product, graphs=graphs)
     output = sct_average_elevation_profile_analysis(
         product_path=product,
         output_quantity=output_radiometric_quantity,
         config=config,
+        product=input_product,
     )
     return _ra_save_and_plot_results(
         output=output,
@@ -165,13 +172,37 @@ def full_scalloping_analysis(
     Path
         Path to the CSV file containing the radiometric statistics
     """
-    graphs_func = _import_ra_graphs_func(graphs)
-    output = sct_scalloping_analysis(product_path=product, config=config)
+    input_product, graphs_func = _prefetch_product_and_graphs_func(product=product, graphs=graphs)
+    output = sct_scalloping_analysis(product_path=product, config=config, product=input_product)
     return _ra_save_and_plot_results(
         output=output, output_directory=output_directory, graphs_func=graphs_func, tag="SCALLOPING", plot_mode="mean"
     )
 
 
+def _prefetch_product_and_graphs_func(product: Path, graphs: bool) -> tuple[SCTInputProduct, Callable | None]:
+    """Loading the input product on a background thread while importing the graphs plotting function.
+
+    Parameters
+    ----------
+    product : Path
+        Path to the product to be analyzed
+    graphs : bool
+        flag to enable graphs generation
+
+    Returns
+    -------
+    SCTInputProduct
+        loaded input product
+    Callable | None
+        radiometric 2D histogram plot function or None if graphs are not required
+    """
+    with ThreadPoolExecutor(max_workers=1) as loader:
+        # product I/O is started first, so that the graphs modules import happens while the product is being read
+        loading = loader.submit(load_radiometric_product, product_path=product)
+        graphs_func = _import_ra_graphs_func(graphs)
+        return loading.result(), graphs_func
+
+
 def _import_ra_graphs_func(graphs: bool) -> Callable | None:
     """Importing the radiometric 2D histogram plotting function."""
     radiometric_2D_hist_plot = None
@@ -215,20 +246,66 @@ def _ra_save_and_plot_results(
     Path
         Path to the CSV file containing the radiometric statistics
     """
-    sct_logger.info("Saving results to netCDF...")
-
     kpi_file = output_directory.joinpath("radiometry_statistics.csv")
+    if graphs_func is None or not output:
+        return _ra_save_results(output=output, output_directory=output_directory, tag=tag, kpi_file=kpi_file), kpi_file
+
+    sct_logger.info("Generating graphs...")
+    titles = []
+    for item in output:
+        assert item.general_info.polarization is not None
+        titles.append(f"{tag.upper()} Profiles {item.general_info.channel}")
+    # graphs rendering is started first, so that results are written while graphs are being rendered
+    with rendering_graphs(
+        _render_ra_graphs, repeat(graphs_func), output, titles, repeat(output_directory), repeat(plot_mode)
+    ) as rendering:
+        netcdf_file = _ra_save_results(output=output, output_directory=output_directory, tag=tag, kpi_file=kpi_file)
+    # retrieving rendering outcomes, so that graphs errors are raised
+    list(rendering)
+    return netcdf_file, kpi_file
+
+
+def _ra_save_results(output: list[RadiometricProfilesOutput], output_directory: Path, tag: str, kpi_file: Path) -> Path:
+    """Saving Radiometric Analysis statistics to CSV and profiles to netCDF.
+
+    Parameters
+    ----------
+    output : list[RadiometricProfilesOutput]
+        radiometric profiles output from the radiometric analysis
+    output_directory : Path
+        Path to the output directory
+    tag : str
+        tag referring to the kind of radiometric analysis performed
+    kpi_file : Path
+        Path to the CSV file where to save the radiometric statistics
+
+    Returns
+    -------
+    Path
+        Path to the NetCDF file containing the radiometric profiles
+    """
+    sct_logger.info("Saving results to netCDF...")
     stats_df = radiometric_statistical_analysis_to_df(data=output)
     stats_df.to_csv(kpi_file, index=False)
-    netcdf_file = radiometric_profiles_to_netcdf(data=output, out_path=output_directory, tag=tag)
-    if graphs_func is not None:
-        sct_logger.info("Generating graphs...")
-        for item in output:
-            assert item.general_info.polarization is not None
-            graphs_func(
-                data=item,
-                out_dir=output_directory,
-                title=f"{tag.upper()} Profiles {item.general_info.channel}",
-                plot_mode=plot_mode,
-            )
-    return netcdf_file, kpi_file
+    return radiometric_profiles_to_netcdf(data=output, out_path=output_directory, tag=tag)
+
+
+def _render_ra_graphs(
+    graphs_func: Callable, data: RadiometricProfilesOutput, title: str, output_directory: Path, plot_mode: str
+) -> None:
+    """Rendering the radiometric 2D histogram graph of a single channel.
+
+    Parameters
+    ----------
+    graphs_func : Callable
+        radiometric 2D histogram plot function
+    data : RadiometricProfilesOutput
+        radiometric profiles output of the channel
+    title : str
+        graph title
+    output_directory : Path
+        Path to the output directory
+    plot_mode : str
+        plot mode to be used for the graphs, min or mean
+    """
+    graphs_func(data=data, out_dir=output_directory, title=title, plot_mode=plot_mode)
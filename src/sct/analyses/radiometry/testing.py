@@ -5,24 +5,23 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable
 from functools import partial
 from pathlib import Path
 
 import numpy as np
 import pandas as pd
-from netCDF4 import Dataset
+from netCDF4 import Dataset, Group
 from perseo_quality.core.generic_dataclasses import SARRadiometricQuantity
 
 from sct.analyses.radiometry.config import SCTRadiometricAnalysisConfig
-from sct.analyses.radiometry.main import (
-    full_average_elevation_profiles_analysis,
-    full_nesz_analysis,
-)
 from sct.testing.utilities.common import ReferenceOutput, TestOutput, TestParams, cli_launcher
 
 ABSOLUTE_TOLERANCE_RA = 1e-2
 ABSOLUTE_TOLERANCE = 1e-5
 KPI_TOLERANCE = 1e-1
+# radiometric profiles variables to be compared, with their absolute tolerances
+VARIABLES_TOLERANCES = {"look_angles": ABSOLUTE_TOLERANCE, "radiometric_profiles": ABSOLUTE_TOLERANCE_RA}
 
 
 def run_nesz_api(
@@ -46,6 +45,8 @@ def run_nesz_api(
     TestOutput
         Paths to output netcdf file and kpi statistics file
     """
+    from sct.analyses.radiometry.main import full_nesz_analysis
+
     nc_results, kpi_results = full_nesz_analysis(
         product=params.product,
         output_directory=output_dir,
@@ -76,6 +77,8 @@ def run_rain_forest_api(
     TestOutput
         Paths to output netcdf file and kpi statistics file
     """
+    from sct.analyses.radiometry.main import full_average_elevation_profiles_analysis
+
     nc_results, kpi_results = full_average_elevation_profiles_analysis(
         product=params.product,
         output_radiometric_quantity=SARRadiometricQuantity.GAMMA_NOUGHT,
@@ -177,51 +180,62 @@ def compare_ra_netcdf_with_tolerances(ref: Path, current: Path) -> None:
     current : Path
         Path to the current run netCDF4 file
     """
-    ref_dataset = Dataset(ref, "r", format="NETCDF4")
-    current_dataset = Dataset(current, "r", format="NETCDF4")
-
-    assert ref_dataset.product == current_dataset.product
-    assert ref_dataset.sensor == current_dataset.sensor
-    assert ref_dataset.product_type == current_dataset.product_type
-    assert ref_dataset.acquisition_mode == current_dataset.acquisition_mode
-    assert ref_dataset.orbit_direction == current_dataset.orbit_direction
-    assert ref_dataset.acquisition_start_time == current_dataset.acquisition_start_time
-    assert ref_dataset.direction == current_dataset.direction
-    assert ref_dataset.output_radiometric_quantity == current_dataset.output_radiometric_quantity
-    assert ref_dataset.groups.keys() == current_dataset.groups.keys()
-    for key, group in ref_dataset.groups.items():
-        current_group = current_dataset.groups[key]
-        assert group.groups.keys() == current_group.groups.keys()
-        for p_key, subgroup in group.groups.items():
-            current_subgroup = current_group.groups[p_key]
-            assert current_subgroup.swath == subgroup.swath
-            assert current_subgroup.channel == subgroup.channel
-            assert current_subgroup.polarization == subgroup.polarization
-            assert subgroup.azimuth_blocks_num == current_subgroup.azimuth_blocks_num
-            assert subgroup.azimuth_block_centers == current_subgroup.azimuth_block_centers
-
-            np.testing.assert_allclose(
-                subgroup.range_block_centers,
-                current_subgroup.range_block_centers,
-                atol=ABSOLUTE_TOLERANCE,
-                rtol=0,
-            )
-
-            np.testing.assert_allclose(
-                subgroup["look_angles"][:],
-                current_subgroup["look_angles"][:],
-                atol=ABSOLUTE_TOLERANCE,
-                rtol=0,
-            )
-            np.testing.assert_allclose(
-                subgroup["radiometric_profiles"][:],
-                current_subgroup["radiometric_profiles"][:],
-                atol=ABSOLUTE_TOLERANCE_RA,
-                rtol=0,
-            )
-
-    ref_dataset.close()
-    current_dataset.close()
+    with (
+        Dataset(ref, "r", format="NETCDF4") as ref_dataset,
+        Dataset(current, "r", format="NETCDF4") as current_dataset,
+    ):
+        assert ref_dataset.product == current_dataset.product
+        assert ref_dataset.sensor == current_dataset.sensor
+        assert ref_dataset.product_type == current_dataset.product_type
+        assert ref_dataset.acquisition_mode == current_dataset.acquisition_mode
+        assert ref_dataset.orbit_direction == current_dataset.orbit_direction
+        assert ref_dataset.acquisition_start_time == current_dataset.acquisition_start_time
+        assert ref_dataset.direction == current_dataset.direction
+        assert ref_dataset.output_radiometric_quantity == current_dataset.output_radiometric_quantity
+        assert ref_dataset.groups.keys() == current_dataset.groups.keys()
+        for key, group in ref_dataset.groups.items():
+            current_group = current_dataset.groups[key]
+            assert group.groups.keys() == current_group.groups.keys()
+            for p_key, subgroup in group.groups.items():
+                current_subgroup = current_group.groups[p_key]
+                assert current_subgroup.swath == subgroup.swath
+                assert current_subgroup.channel == subgroup.channel
+                assert current_subgroup.polarization == subgroup.polarization
+                assert subgroup.azimuth_blocks_num == current_subgroup.azimuth_blocks_num
+                assert subgroup.azimuth_block_centers == current_subgroup.azimuth_block_centers
+
+                np.testing.assert_allclose(
+                    subgroup.range_block_centers,
+                    current_subgroup.range_block_centers,
+                    atol=ABSOLUTE_TOLERANCE,
+                    rtol=0,
+                )
+
+                ref_variables = _read_variables(subgroup, VARIABLES_TOLERANCES)
+                current_variables = _read_variables(current_subgroup, VARIABLES_TOLERANCES)
+                for name, tolerance in VARIABLES_TOLERANCES.items():
+                    np.testing.assert_allclose(
+                        ref_variables[name], current_variables[name], atol=tolerance, rtol=0, err_msg=name
+                    )
+
+
+def _read_variables(group: Group, names: Iterable[str]) -> dict[str, np.ndarray]:
+    """Reading the selected variables of a netCDF group into memory in a single pass.
+
+    Parameters
+    ----------
+    group : Group
+        netCDF group
+    names : Iterable[str]
+        names of the variables to be read
+
+    Returns
+    -------
+    dict[str, np.ndarray]
+        variables data by name
+    """
+    variables = group.variables
+    return {name: variables[name][:] for name in names}
 
 
 def compare_kpi_stats(ref: pd.DataFrame, current: pd.DataFrame) -> None:
@@ -5,9 +5,9 @@
 
 from __future__ import annotations
 
+from sct.analyses import lazy_main_getattr
 from sct.analyses.spectra.cli import spectral_analysis
 from sct.analyses.spectra.config import SCTSpectralAnalysisConfig
-from sct.analyses.spectra.main import full_spectral_analysis
 from sct.analyses.spectra.testing import (
     run_spectral_api,
     run_spectral_cli,
@@ -32,4 +32,7 @@ register_analysis(
     ),
 )
 
+
 __all__ = ["full_spectral_analysis"]
+
+__getattr__ = lazy_main_getattr(__name__, __all__)
@@ -5,11 +5,11 @@
 
 from __future__ import annotations
 
-from dataclasses import asdict, dataclass, fields
+from dataclasses import asdict, dataclass
 from pathlib import Path
 
 from sct.analyses.spectra.resources import config_schema
-from sct.configuration.common import InvalidConfigurationFile
+from sct.configuration.common import InvalidConfigurationFile, dataclass_field_names
 from sct.configuration.config_abc import AnalysisConfigABC
 
 
@@ -26,7 +26,7 @@ class SCTSpectralAnalysisConfig(AnalysisConfigABC):
     def from_dict(cls, arg: dict) -> SCTSpectralAnalysisConfig:
         """Convert from dict"""
         out = cls()
-        valid_fields = [f.name for f in fields(out)]
+        valid_fields = dataclass_field_names(cls)
 
         for key, value in arg.items():
             if key not in valid_fields:
@@ -11,7 +11,6 @@ import numpy as np
 from netCDF4 import Dataset
 
 from sct.analyses.spectra.config import SCTSpectralAnalysisConfig
-from sct.analyses.spectra.main import full_spectral_analysis
 from sct.testing.utilities.common import ReferenceOutput, TestOutput, TestParams, cli_launcher
 
 ABSOLUTE_TOLERANCE = 1e-5
@@ -38,6 +37,8 @@ def run_spectral_api(
     TestOutput
         Paths to output netcdf file and kpi statistics file
     """
+    from sct.analyses.spectra.main import full_spectral_analysis
+
     nc_results = full_spectral_analysis(
         product=params.product,
         point_target_source=params.targets,
@@ -13,7 +13,6 @@ from functools import wraps
 from pathlib import Path
 from typing import Annotated, Callable, Literal
 
-import art
 import typer
 
 from sct.configuration.logger import enable_quality_logger, sct_logger
@@ -149,8 +148,16 @@ def logging_to_file(path: Path | None):
 
 
 def display_title(title: str) -> None:
-    """Display a title in the CLI."""
+    """Display a title in the CLI, as an ascii art banner only when writing to a terminal."""
     typer.echo("\n")
+    if not sys.stdout.isatty():
+        # banner would only clutter redirected outputs, plain title is enough
+        typer.echo(title + "\n")
+        return
+
+    # ascii art fonts are imported only when a banner is actually displayed, keeping CLI startup fast
+    import art
+
     txt = art.text2art(title, font="doom")
     assert isinstance(txt, str)
     typer.echo(txt + "\n")
@@ -11,14 +11,9 @@ from typing import Annotated
 
 import typer
 from perseo_core.timing import PreciseDateTime
-from perseo_perturbations.atmospheric.ionosphere import IonosphericAnalysisCenters
-from perseo_perturbations.atmospheric.troposphere import TroposphericGRIDResolution
 
 from sct.cli import common
 from sct.io.point_target_manager import convert_rosamond_file_to_compliant_csv, read_geojson_point_targets_file
-from sct.web_scraping.cddis_downloader import InvalidCDDISRequest
-from sct.web_scraping.ionosphere_tec_map_downloader import download_ionospheric_tec_maps
-from sct.web_scraping.troposphere_maps_downloader import download_tropospheric_products
 
 utilities_app = typer.Typer(help="SCT Auxiliary CLI tools.")
 
@@ -100,6 +95,11 @@ ResolutionOption = Annotated[
 ]
 
 
+def _to_precise_date_time(date: datetime) -> PreciseDateTime:
+    """Converting a command line date to PreciseDateTime, sub-second information is discarded."""
+    return PreciseDateTime.from_numeric_datetime(date.year, date.month, date.day, date.hour, date.minute, date.second)
+
+
 @utilities_app.command("rosamond-pt-converter")
 def convert_rosamond_csv(
     source: RosamondSourceOption,
@@ -110,14 +110,7 @@ def convert_rosamond_csv(
     if output_directory is None:
         output_directory = source.parent
 
-    acq_date = PreciseDateTime.from_numeric_datetime(
-        date.year,
-        date.month,
-        date.day,
-        date.hour,
-        date.minute,
-        date.second,
-    )
+    acq_date = _to_precise_date_time(date)
 
     typer.echo("Converting original Rosamond dataset to SCT .csv compliant format...")
     rosamond_data = convert_rosamond_file_to_compliant_csv(df=source, measurement_date=acq_date)
@@ -134,21 +127,19 @@ def download_ionex_tec_maps(
     output_directory: common.OutputDirectoryOption,
 ) -> None:
     """Download IONEX TEC maps from NASA/CDDIS archive."""
-    try:
-        center = IonosphericAnalysisCenters[analysis_center.upper()]
-    except KeyError:
+    # atmospheric perturbations and downloaders are imported only when the command is run, keeping CLI startup fast
+    from perseo_perturbations.atmospheric.ionosphere import IonosphericAnalysisCenters
+
+    from sct.web_scraping.cddis_downloader import InvalidCDDISRequest
+    from sct.web_scraping.ionosphere_tec_map_downloader import download_ionospheric_tec_maps
+
+    center = IonosphericAnalysisCenters.__members__.get(analysis_center.upper())
+    if center is None:
         typer.echo("Wrong center name. Check the --help section to see available analysis centers")
-        utilities_app.Abort()
+        raise typer.Abort()
 
     typer.echo("Downloading IONEX TEC maps from NASA/CDDIS archive...")
-    acq_date = PreciseDateTime.from_numeric_datetime(
-        date.year,
-        date.month,
-        date.day,
-        date.hour,
-        date.minute,
-        date.second,
-    )
+    acq_date = _to_precise_date_time(date)
     try:
         outfile = download_ionospheric_tec_maps(
             acq_date=acq_date,
@@ -157,9 +148,9 @@ def download_ionex_tec_maps(
             output_dir=output_directory,
         )
         typer.echo(f"Output file can be found here {outfile}.")
-    except InvalidCDDISRequest:
+    except InvalidCDDISRequest as err:
         typer.echo("ERROR: Invalid Request. Invalid e-mail or file requested does not exist.")
-        utilities_app.Abort()
+        raise typer.Abort() from err
 
 
 @utilities_app.command("tropo-downloader")
@@ -170,21 +161,17 @@ def download_tropospheric_vmf3_maps(
 ) -> None:
     """Download VMF3 Tropospheric Products."""
 
-    try:
-        grid_res = TroposphericGRIDResolution[resolution.upper()]
-    except KeyError:
+    from perseo_perturbations.atmospheric.troposphere import TroposphericGRIDResolution
+
+    from sct.web_scraping.troposphere_maps_downloader import download_tropospheric_products
+
+    grid_res = TroposphericGRIDResolution.__members__.get(resolution.upper())
+    if grid_res is None:
         typer.echo("Wrong grid resolution. Check the --help section to see available resolutions")
-        utilities_app.Abort()
+        raise typer.Abort()
 
     typer.echo("Downloading VMF3 tropospheric products...")
-    acq_date = PreciseDateTime.from_numeric_datetime(
-        date.year,
-        date.month,
-        date.day,
-        date.hour,
-        date.minute,
-        date.second,
-    )
+    acq_date = _to_precise_date_time(date)
 
     outfiles = download_tropospheric_products(
         acq_date=acq_date,
@@ -209,14 +196,7 @@ def convert_sarcalnet_json_to_csv(
 
     acq_date = None
     if product_date is not None:
-        acq_date = PreciseDateTime.from_numeric_datetime(
-            product_date.year,
-            product_date.month,
-            product_date.day,
-            product_date.hour,
-            product_date.minute,
-            product_date.second,
-        )
+        acq_date = _to_precise_date_time(product_date)
 
     typer.echo("Converting SARCalNet survey target locations dataset to SCT .csv compliant format...")
     survey_data = read_geojson_point_targets_file(surveys=source, product_date=acq_date)
@@ -5,16 +5,43 @@
 
 from __future__ import annotations
 
+import copy
 import json
+import os
+import tomllib
+from dataclasses import fields
+from functools import cache, lru_cache
 from pathlib import Path
 
-from jsonschema import validate
+from jsonschema.exceptions import best_match
+from jsonschema.protocols import Validator
+from jsonschema.validators import validator_for
+
+# environment variable to skip the validation of trusted configuration files
+SKIP_VALIDATION_ENV_VAR = "SCT_SKIP_CONFIG_VALIDATION"
 
 
 class InvalidConfigurationFile(RuntimeError):
     """Invalid SCT .toml configuration file"""
 
 
+@cache
+def dataclass_field_names(cls: type) -> frozenset[str]:
+    """Names of the fields of a configuration dataclass, computed only once for each class.
+
+    Parameters
+    ----------
+    cls : type
+        configuration dataclass
+
+    Returns
+    -------
+    frozenset[str]
+        names of the dataclass fields
+    """
+    return frozenset(f.name for f in fields(cls))
+
+
 def toml_schema_validation(content: dict, schema_path: str | Path):
     """Validation of input configuration file for SCT tool.
 
@@ -24,9 +51,89 @@ def toml_schema_validation(content: dict, schema_path: str | Path):
         dictionary containing the parsed toml content
     schema_path : str | Path
         path to the json schema file
+
+    Notes
+    -----
+    Validation is skipped if the SCT_SKIP_CONFIG_VALIDATION environment variable is set to a truthy value
+    (1, true, yes).
     """
     assert str(schema_path).endswith(".json")
+    if _skip_validation():
+        return
+    validator = _load_schema_validator(Path(schema_path))
+
+    error = best_match(validator.iter_errors(content))
+    if error is not None:
+        raise error
+
+
+def read_toml_configuration(file: Path, schema_path: str | Path) -> dict:
+    """Reading and validating a .toml configuration file.
+
+    Parsed and validated contents are cached by file path, modification time and size, so that loading the same
+    unchanged file again skips parsing and validation.
+
+    Parameters
+    ----------
+    file : Path
+        path to the .toml configuration file
+    schema_path : str | Path
+        path to the json schema file
+
+    Returns
+    -------
+    dict
+        dictionary containing the parsed toml content, a new copy at each call
+    """
+    file = file.resolve()
+    stat = file.stat()
+    content = _read_toml_configuration(
+        file=file,
+        mtime_ns=stat.st_mtime_ns,
+        size=stat.st_size,
+        schema_path=Path(schema_path),
+        skip_validation=_skip_validation(),
+    )
+    # configurations are built from the content in place, each caller gets its own copy
+    return copy.deepcopy(content)
+
+
+@lru_cache(maxsize=8)
+def _read_toml_configuration(file: Path, mtime_ns: int, size: int, schema_path: Path, skip_validation: bool) -> dict:
+    """Parsing and validating a .toml configuration file, caching the result.
+
+    Modification time, size and validation flag are part of the cache key only.
+    """
+    with open(file, "rb") as f:
+        content = tomllib.load(f)
+
+    toml_schema_validation(content=content, schema_path=schema_path)
+
+    return content
+
+
+def _skip_validation() -> bool:
+    """Checking whether configuration files validation has been disabled through the environment variable."""
+    return os.environ.get(SKIP_VALIDATION_ENV_VAR, "").strip().lower() in ("1", "true", "yes")
+
+
+@lru_cache(maxsize=None)
+def _load_schema_validator(schema_path: Path) -> Validator:
+    """Loading the json schema and building the corresponding validator, only once for each schema file.
+
+    Parameters
+    ----------
+    schema_path : Path
+        path to the json schema file
+
+    Returns
+    -------
+    Validator
+        json schema validator
+    """
     with open(schema_path, "r", encoding="utf-8") as schema_file:
         json_schema = json.load(schema_file)
 
-    validate(content, json_schema)
+    validator_class = validator_for(json_schema)
+    validator_class.check_schema(json_schema)
+    return validator_class(json_schema)
@@ -5,12 +5,12 @@
 
 from __future__ import annotations
 
-from dataclasses import asdict, dataclass, fields
+from dataclasses import asdict, dataclass
 from pathlib import Path
 
 import toml
 
-from sct.configuration.common import InvalidConfigurationFile, toml_schema_validation
+from sct.configuration.common import InvalidConfigurationFile, dataclass_field_names, read_toml_configuration
 from sct.resources import config_schema
 
 
@@ -26,7 +26,7 @@ class GeneralConfiguration:
     def from_dict(cls, arg: dict) -> GeneralConfiguration:
         """Convert from dict"""
         out = cls()
-        valid_fields = [f.name for f in fields(out)]
+        valid_fields = dataclass_field_names(cls)
 
         for key, value in arg.items():
             if key not in valid_fields:
@@ -61,10 +61,7 @@ class GeneralConfiguration:
         if file.suffix != ".toml":
             raise InvalidConfigurationFile(f"Input file {file} is not a .toml configuration file")
 
-        with open(file, "r", encoding="UTF-8") as f:
-            config = toml.load(f)
-
-        toml_schema_validation(content=config, schema_path=config_schema)
+        config = read_toml_configuration(file=file, schema_path=config_schema)
 
         if "general" in config:
             configuration = cls.from_dict(config["general"])
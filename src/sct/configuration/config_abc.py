@@ -11,7 +11,7 @@ from typing import Self
 
 import toml
 
-from sct.configuration.common import InvalidConfigurationFile, toml_schema_validation
+from sct.configuration.common import InvalidConfigurationFile, read_toml_configuration
 
 
 class AnalysisConfigABC(ABC):
@@ -50,10 +50,7 @@ class AnalysisConfigABC(ABC):
         if file.suffix != ".toml":
             raise InvalidConfigurationFile(f"Input file {file} is not a .toml configuration file")
 
-        with open(file, "r", encoding="UTF-8") as f:
-            config = toml.load(f)
-
-        toml_schema_validation(content=config, schema_path=cls.validation_schema)
+        config = read_toml_configuration(file=file, schema_path=cls.validation_schema)
 
         return cls.from_dict(config[cls.config_group_name])
 
@@ -46,7 +46,7 @@ def read_antenna_pattern_netcdf(path: Path) -> dict[str, dict[str, xr.Dataset]]:
     for swath, direction_groups in am_ds.groups.items():
         antenna_pattern_datasets[swath] = {}
         assert len(direction_groups.groups) == 1
-        dir_group = direction_groups.groups[list(direction_groups.groups.keys())[0]]
+        dir_group = next(iter(direction_groups.groups.values()))
         for pol, pol_group in dir_group.groups.items():
             ds = xr.Dataset(
                 {
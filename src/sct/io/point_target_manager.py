@@ -6,6 +6,7 @@
 from __future__ import annotations
 
 import json
+from functools import lru_cache
 from pathlib import Path
 
 import numpy as np
@@ -51,6 +52,9 @@ def extract_point_target_data_from_source(source: str | Path) -> pd.DataFrame:
 def read_csv_point_targets_file(source: Path) -> pd.DataFrame:
     """Reading the input .csv file containing Point Target locations and info and converting it to a Pandas DataFrame.
 
+    The parsed file is cached by path and modification time, so that the same unchanged file is parsed only once
+    when analysing several products.
+
     Parameters
     ----------
     source : Path
@@ -61,6 +65,15 @@ def read_csv_point_targets_file(source: Path) -> pd.DataFrame:
     pd.DataFrame
         Point Targets DataFrame
     """
+    source = Path(source).resolve()
+    stat = source.stat()
+    # returning a copy to prevent callers from altering the cached dataframe
+    return _parse_csv_point_targets_file(source, stat.st_mtime_ns, stat.st_size).copy()
+
+
+@lru_cache(maxsize=8)
+def _parse_csv_point_targets_file(source: Path, mtime_ns: int, size: int) -> pd.DataFrame:
+    """Parsing the point targets .csv file, modification time and size are used only to invalidate the cache."""
     df = pd.read_csv(source)
     for date_in in ("measurement_date", "validity_start_date", "validity_stop_date"):
         if not df["measurement_date"].isnull().all():
@@ -140,21 +153,30 @@ def convert_df_to_nominal_point_target(data_df: pd.DataFrame) -> list[PointTarge
     list[PointTarget]
         list of Point Target objects
     """
-    pt_data = []
-    for _, row in data_df.iterrows():
-        pt_data.append(
-            PointTarget(
-                name=row["target_name"],
-                xyz_coordinates=row[["x_coord_m", "y_coord_m", "z_coord_m"]].to_numpy(dtype=float),
-                delay=row["delay_s"] if not np.isnan(row["delay_s"]) else None,
-                rcs_hh=row["rcs_hh_dB"],
-                rcs_hv=row["rcs_hv_dB"],
-                rcs_vh=row["rcs_vh_dB"],
-                rcs_vv=row["rcs_vv_dB"],
-            )
+    # extracting coordinates and delays as arrays once, instead of indexing each row
+    coordinates = data_df[["x_coord_m", "y_coord_m", "z_coord_m"]].to_numpy(dtype=float)
+    delays = data_df["delay_s"].to_numpy(dtype=float)
+    return [
+        PointTarget(
+            name=name,
+            xyz_coordinates=xyz,
+            delay=delay if not np.isnan(delay) else None,
+            rcs_hh=rcs_hh,
+            rcs_hv=rcs_hv,
+            rcs_vh=rcs_vh,
+            rcs_vv=rcs_vv,
         )
-
-    return pt_data
+        for name, xyz, delay, rcs_hh, rcs_hv, rcs_vh, rcs_vv in zip(
+            data_df["target_name"],
+            coordinates,
+            delays,
+            data_df["rcs_hh_dB"],
+            data_df["rcs_hv_dB"],
+            data_df["rcs_vh_dB"],
+            data_df["rcs_vv_dB"],
+            strict=True,
+        )
+    ]
 
 
 def convert_rosamond_file_to_compliant_csv(
@@ -58,6 +58,16 @@ OutputDirectoryOption1 = Annotated[
     ),
 ]
 
+WorkersOption = Annotated[
+    int,
+    typer.Option(
+        "--workers",
+        "-w",
+        min=1,
+        help="Number of processes used to run tests in parallel",
+    ),
+]
+
 
 @testing_app.command("test")
 def integration_testing(
@@ -65,6 +75,7 @@ def integration_testing(
     output_directory: OutputDirectoryOption1,
     cli: CLIOption = False,
     graphs: common.GraphsOption = False,
+    workers: WorkersOption = 1,
 ) -> None:
     """Run SCT integration tests procedure from registry."""
     common.display_title("SCT Integration Tests")
@@ -81,7 +92,7 @@ def integration_testing(
         typer.echo("Output directory not found: creating the output folder.")
         output_directory.mkdir(parents=True)
 
-    results = run_tests(registry_path=registry, output_dir=output_directory, cli=cli, graphs=graphs)
+    results = run_tests(registry_path=registry, output_dir=output_directory, cli=cli, graphs=graphs, workers=workers)
 
     common.display_title("Summary")
 
@@ -6,19 +6,28 @@
 from __future__ import annotations
 
 import json
+import multiprocessing
+import os
 import time
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from itertools import repeat
 from pathlib import Path
 
-import numpy as np
 from rich.console import Console
 from rich.table import Table
 
-from sct.configuration.logger import sct_logger
+from sct.configuration.logger import ConsoleHandler, enable_quality_logger, sct_logger
 from sct.testing.utilities.common import TestParams
 from sct.testing.utilities.executor import execute_analysis_test
 
 console = Console(soft_wrap=True, force_terminal=True, color_system="truecolor")
 
+# number of BLAS/OpenMP threads granted to each parallel test worker to avoid cores oversubscription
+WORKER_THREADS = 2
+_WORKER_THREADS_VARIABLES = ("OMP_NUM_THREADS", "OPENBLAS_NUM_THREADS", "MKL_NUM_THREADS")
+
 
 def test_session(params: TestParams, sensor: str, test_name: str, output_dir: Path, graphs: bool, cli: bool) -> bool:
     """Executing SCT single test using API interface.
@@ -64,7 +73,61 @@ def test_session(params: TestParams, sensor: str, test_name: str, output_dir: Pa
         return False
 
 
-def run_tests(registry_path: str | Path, output_dir: str | Path, graphs: bool = False, cli: bool = False) -> dict:
+@contextmanager
+def _limited_worker_threads() -> Iterator[None]:
+    """Capping the number of BLAS/OpenMP threads of the worker processes started within the context.
+
+    Variables are set in the parent process and restored on exit, workers read them at startup before loading the
+    numerical libraries.
+    """
+    previous_values = {var: os.environ.get(var) for var in _WORKER_THREADS_VARIABLES}
+    os.environ.update(dict.fromkeys(_WORKER_THREADS_VARIABLES, str(WORKER_THREADS)))
+    try:
+        yield
+    finally:
+        for var, value in previous_values.items():
+            if value is None:
+                os.environ.pop(var, None)
+            else:
+                os.environ[var] = value
+
+
+def _init_test_worker() -> None:
+    """Initializer of parallel test workers, configuring the logger as done by the SCT CLI entry point."""
+    sct_logger.setLevel("INFO")
+    sct_logger.addHandler(ConsoleHandler())
+    enable_quality_logger()
+
+
+def _timed_test_session(
+    params: TestParams, sensor: str, test_name: str, output_dir: Path, graphs: bool, cli: bool
+) -> tuple[bool, float]:
+    """Executing a single test session measuring its elapsed time.
+
+    Returns
+    -------
+    tuple[bool, float]
+        test outcome, elapsed time in seconds
+    """
+    start_time = time.perf_counter()
+    outcome = test_session(
+        params=params, sensor=sensor, test_name=test_name, output_dir=output_dir, graphs=graphs, cli=cli
+    )
+    return outcome, time.perf_counter() - start_time
+
+
+def _log_elapsed_time(time_spent: float) -> None:
+    """Logging the elapsed time of a test."""
+    if time_spent < 60:
+        sct_logger.info(f"Elapsed: {time_spent:.0f} seconds")
+    else:
+        sct_logger.info(f"Elapsed: {time_spent / 60:.2f} minutes")
+    sct_logger.info("")
+
+
+def run_tests(
+    registry_path: str | Path, output_dir: str | Path, graphs: bool = False, cli: bool = False, workers: int = 1
+) -> dict:
     """Running all the SCT Integration Tests from input registry
 
     Parameters
@@ -77,6 +140,8 @@ def run_tests(registry_path: str | Path, output_dir: str | Path, graphs: bool =
         flag to enable graphs generation, by default False
     cli : bool, optional
         flag to enable cli usage instead of api, by default False
+    workers : int, optional
+        number of processes used to run tests concurrently, by default 1 (serial execution)
     """
 
     registry_path = Path(registry_path)
@@ -90,6 +155,11 @@ def run_tests(registry_path: str | Path, output_dir: str | Path, graphs: bool =
     with open(registry_path, "r", encoding="UTF-8") as f_in:
         test_config = json.load(f_in)
 
+    if workers > 1:
+        return _run_tests_parallel(
+            test_config=test_config, output_dir=output_dir, graphs=graphs, cli=cli, workers=workers
+        )
+
     results = {}
     for sensor, parameters in test_config.items():
         sct_logger.info("")
@@ -108,12 +178,70 @@ def run_tests(registry_path: str | Path, output_dir: str | Path, graphs: bool =
                 params=params, sensor=sensor, test_name=test_name, output_dir=output_dir, graphs=graphs, cli=cli
             )
 
-            time_spent = time.perf_counter() - start_time
-            if time_spent < 60:
-                sct_logger.info(f"Elapsed: {np.round(time_spent)} seconds")
-            else:
-                sct_logger.info(f"Elapsed: {np.round(time_spent / 60, 2)} minutes")
-            sct_logger.info("")
+            _log_elapsed_time(time.perf_counter() - start_time)
+
+    return results
+
+
+def _run_tests_parallel(test_config: dict, output_dir: Path, graphs: bool, cli: bool, workers: int) -> dict:
+    """Running the integration tests concurrently in a pool of worker processes.
+
+    Tests are independent and each one writes to its own output directory, so they can be safely executed in
+    parallel. Results are collected in registry order.
+
+    Parameters
+    ----------
+    test_config : dict
+        tests registry content, sensors as keys and tests parameters as values
+    output_dir : Path
+        Path to the output directory where to save results
+    graphs : bool
+        flag to enable graphs generation
+    cli : bool
+        flag to enable cli usage instead of api
+    workers : int
+        number of worker processes
+
+    Returns
+    -------
+    dict
+        tests results by sensor and test name
+    """
+    sct_logger.info(f"Running tests in parallel using {workers} workers")
+    sct_logger.info("")
+
+    sensors, test_names, params = [], [], []
+    for sensor, parameters in test_config.items():
+        for test_name, test_params in parameters.items():
+            sensors.append(sensor)
+            test_names.append(test_name)
+            params.append(TestParams.from_dict(test_params))
+    # batching tasks submission to reduce inter-process communication overhead
+    chunksize = max(1, len(params) // (4 * workers))
+
+    results = {sensor: {} for sensor in test_config}
+    # workers are spawned so that they load BLAS/OpenMP libraries from scratch honouring the threads limits, forked
+    # workers would inherit the thread pools already initialized by the parent process
+    with (
+        _limited_worker_threads(),
+        ProcessPoolExecutor(
+            max_workers=workers, mp_context=multiprocessing.get_context("spawn"), initializer=_init_test_worker
+        ) as executor,
+    ):
+        outcomes = executor.map(
+            _timed_test_session,
+            params,
+            sensors,
+            test_names,
+            repeat(output_dir),
+            repeat(graphs),
+            repeat(cli),
+            chunksize=chunksize,
+        )
+        for sensor, test_name, (outcome, time_spent) in zip(sensors, test_names, outcomes, strict=True):
+            results[sensor][test_name] = outcome
+            sct_logger.info(f"Test {sensor.upper()} - {test_name.upper()} completed")
+            _log_elapsed_time(time_spent)
 
     return results
 
@@ -132,14 +260,20 @@ def summary_results(results: dict) -> bool:
         True if all tests are passed, else False
     """
 
-    tests_num = sum([len(c.keys()) for c in results.values()])
-    passed_tests = sum([sum(c.values()) for c in results.values()])
-    sct_logger.info(f"PASSED: {passed_tests}/{tests_num} tests")
-    if passed_tests == tests_num:
+    tests_num = sum(len(c) for c in results.values())
+    failed_tests = [
+        f"{sensor_name}/{test_name}"
+        for sensor_name, tests in results.items()
+        for test_name, test_result in tests.items()
+        if not test_result
+    ]
+    sct_logger.info(f"PASSED: {tests_num - len(failed_tests)}/{tests_num} tests")
+    if not failed_tests:
         sct_logger.info("No FAILED tests")
         outcome = True
     else:
-        sct_logger.critical(f"FAILED: {tests_num - passed_tests}")
+        sct_logger.critical(f"FAILED: {len(failed_tests)}")
+        sct_logger.critical(f"FAILED tests: {', '.join(failed_tests)}")
         outcome = False
     for sensor_name in results:
         try:
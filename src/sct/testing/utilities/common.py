@@ -11,6 +11,7 @@ import os
 from dataclasses import dataclass
 from pathlib import Path
 
+import pandas as pd
 from typer.testing import CliRunner
 
 
@@ -21,6 +22,7 @@ class TestOutput:
     __test__ = False
     csv_results: Path | None = None
     netcdf_results: Path | None = None
+    dataframe_results: pd.DataFrame | None = None
 
 
 @dataclass
@@ -64,29 +66,28 @@ class TestParams:
         """
         out = cls()
         for key, val in arg.items():
-            if isinstance(val, str):
-                val = os.path.expandvars(val)
-            elif isinstance(val, list):
-                val = [os.path.expandvars(v) if isinstance(v, str) else v for v in val]
             if key == "analysis":
-                setattr(out, key, val)
+                # normalizing the analysis name once at load time to match the registered analysis types
+                setattr(out, key, os.path.expandvars(val).strip().lower())
             elif key == "reference_output":
                 if not isinstance(val, list):
                     val = [val]
                 assert len(val) <= 2
-                nc_ref = [v for v in val if str(v).endswith(".nc")]
-                csv_ref = [v for v in val if str(v).endswith(".csv")]
+                # matching reference files by extension in a single pass, keeping the first one of each type
+                references = {}
+                for ref in val:
+                    ref = os.path.expandvars(ref)
+                    references.setdefault(os.path.splitext(ref)[1], ref)
                 setattr(
                     out,
                     key,
-                    ReferenceOutput(
-                        csv_reference=csv_ref[0] if csv_ref else None, netcdf_reference=nc_ref[0] if nc_ref else None
-                    ),
+                    ReferenceOutput(csv_reference=references.get(".csv"), netcdf_reference=references.get(".nc")),
                 )
+            elif isinstance(val, list):
+                setattr(out, key, [Path(os.path.expandvars(v)) for v in val])
             else:
-                if isinstance(val, list):
-                    setattr(out, key, [Path(v) for v in val])
-                elif val != "":
+                val = os.path.expandvars(val)
+                if val != "":
                     setattr(out, key, Path(val))
         return out
 
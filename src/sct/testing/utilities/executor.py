@@ -44,9 +44,6 @@ def execute_analysis_test(
 
     testing_handler: AnalysisTestingHandler | None = handler.testing
 
-    if handler is None:
-        raise ValueError(f"Unsupported analysis type: {test_params.analysis}")
-
     if testing_handler is None:
         raise ValueError(f"Unsupported testing for analysis type: {test_params.analysis}")
 
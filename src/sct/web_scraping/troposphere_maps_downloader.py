@@ -4,6 +4,7 @@
 """Troposphere products downloader utilities."""
 
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
 from pathlib import Path
 
@@ -91,8 +92,7 @@ def download_tropospheric_products(
     output_dir = Path(output_dir)
     map_names, _ = generate_tropospheric_map_name_for_vmf_data(acq_time=acq_date, map_type=map_type)
 
-    out_files = []
-    for file in map_names:
+    def _download_map(file: str) -> Path:
         download_link = _generate_download_link_vmf(
             acq_time=acq_date, map_name=file, map_resolution=map_grid_resolution
         )
@@ -101,9 +101,11 @@ def download_tropospheric_products(
 
         filename = output_dir.joinpath(file)
 
-        with open(output_dir.joinpath(file), "wb") as f_out:
+        with open(filename, "wb") as f_out:
             f_out.write(response.content)
 
-        out_files.append(filename)
+        return filename
 
-    return out_files
+    # maps are independent files, downloading them concurrently as the download is network-bound
+    with ThreadPoolExecutor(max_workers=max(len(map_names), 1)) as executor:
+        return list(executor.map(_download_map, map_names))
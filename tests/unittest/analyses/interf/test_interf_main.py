@@ -0,0 +1,27 @@
+"""Testing interferometric analysis main functions"""
+
+from unittest import mock
+
+from sct.analyses.interferometry.config import SCTInterferometricAnalysisConfig
+from sct.analyses.interferometry.main import full_interferometric_analysis
+
+
+def test_full_interferometric_analysis_graphs(tmp_path):
+    coherence_res = [mock.Mock(), mock.Mock()]
+    graphs_func = mock.Mock()
+    config = SCTInterferometricAnalysisConfig()
+    module = "sct.analyses.interferometry.main"
+    with mock.patch(f"{module}.render_graphs", side_effect=lambda func, *iterables: list(map(func, *iterables))):
+        with mock.patch(f"{module}._import_interf_graphs_func", return_value=graphs_func):
+            with mock.patch(f"{module}.sct_interferometric_coherence_analysis", return_value=coherence_res):
+                with mock.patch(f"{module}.coherence_histograms_to_netcdf", return_value="file.nc") as mock_netcdf:
+                    netcdf_file = full_interferometric_analysis(
+                        product=tmp_path, product_2=None, output_directory=tmp_path, config=config, graphs=True
+                    )
+
+    assert netcdf_file == "file.nc"
+    mock_netcdf.assert_called_once_with(data=coherence_res, output_dir=tmp_path)
+    assert graphs_func.call_count == 4
+    modes = sorted((id(c.kwargs["data"]), c.kwargs["mode"]) for c in graphs_func.call_args_list)
+    expected = sorted((id(res), mode) for res in coherence_res for mode in ("magnitude", "phase"))
+    assert modes == expected
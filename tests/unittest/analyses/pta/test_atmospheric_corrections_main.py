@@ -72,3 +72,32 @@ def test_run_compute_atmospheric_delays(mocker):
 def test_convert_atmospheric_delays_to_df():
     targets = pd.DataFrame([["Name"]], columns=["target_name"])["target_name"]
     convert_atmospheric_delays_to_df(targets, delays=(np.array([0.1]), None))
+
+
+def test_convert_atmospheric_delays_to_df_input_not_altered():
+    point_targets_df = pd.DataFrame({"target_name": ["T1", "T2"], "x_coord_m": [0.0, 1.0]})
+    df = convert_atmospheric_delays_to_df(
+        point_targets_df["target_name"], delays=(None, (np.array([0.1, 0.2]), np.array([0.3, 0.4])))
+    )
+    df.loc[0, "target_name"] = "altered"
+
+    assert point_targets_df.columns.to_list() == ["target_name", "x_coord_m"]
+    assert point_targets_df.loc[0, "target_name"] == "T1"
+
+
+def test_convert_atmospheric_delays_to_df_values():
+    targets = pd.Series(["T1", "T2"], name="target_name")
+    df = convert_atmospheric_delays_to_df(targets, delays=(np.array([0.1, 0.2]), None))
+    assert df.columns.to_list() == [
+        "target_name",
+        "ionospheric_delay_range_correction_[m]",
+        "tropospheric_delay_hydrostatic_range_correction_[m]",
+        "tropospheric_delay_wet_range_correction_[m]",
+    ]
+    np.testing.assert_allclose(df["ionospheric_delay_range_correction_[m]"], [0.1, 0.2])
+    assert df["tropospheric_delay_wet_range_correction_[m]"].isna().all()
+
+    df = convert_atmospheric_delays_to_df(targets, delays=(None, (np.array([1.0, 2.0]), np.array([3.0, 4.0]))))
+    assert df["ionospheric_delay_range_correction_[m]"].isna().all()
+    np.testing.assert_allclose(df["tropospheric_delay_hydrostatic_range_correction_[m]"], [1.0, 2.0])
+    np.testing.assert_allclose(df["tropospheric_delay_wet_range_correction_[m]"], [3.0, 4.0])
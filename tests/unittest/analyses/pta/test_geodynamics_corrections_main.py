@@ -5,6 +5,7 @@
 
 import numpy as np
 import pandas as pd
+import pytest
 from perseo_core.timing import PreciseDateTime
 
 from sct.analyses.point_target.config import SCTPointTargetAnalysisConfig
@@ -36,3 +37,62 @@ def test_run_compute_geodynamics_corrections(mocker):
         default_conf.corrections.enable_plate_tectonics_correction,
         default_conf.corrections.enable_solid_tides_correction,
     )
+
+
+def _point_targets_df(measurement_date) -> pd.DataFrame:
+    columns = ["validity_start_date", "validity_stop_date", "measurement_date", "plate"]
+    values = [
+        [PreciseDateTime.from_numeric_datetime(1999), PreciseDateTime.from_numeric_datetime(2001), date, "EURA"]
+        for date in (measurement_date, measurement_date, PreciseDateTime.from_numeric_datetime(1999))
+    ]
+    return pd.DataFrame(values, columns=columns)
+
+
+def test_run_compute_geodynamics_corrections_plate_tectonics(mocker):
+    mock_compute = mocker.patch(
+        "sct.analyses.point_target.core.geodynamics_corrections_main.compute_geodynamics_corrections"
+    )
+    acquisition_time = PreciseDateTime.from_numeric_datetime(2000, hours=2)
+    pt_df = _point_targets_df(PreciseDateTime.from_numeric_datetime(2000, hours=1))
+
+    run_compute_geodynamics_corrections(np.zeros((3, 3)), acquisition_time, pt_df, True, False)
+
+    plate_tectonics_input = mock_compute.call_args.kwargs["plate_tectonics_input"]
+    assert plate_tectonics_input.time_delta_s == 3600
+    assert plate_tectonics_input.plate_ref == "EURA"
+
+
+def test_run_compute_geodynamics_corrections_missing_dates():
+    pt_df = _point_targets_df(PreciseDateTime.from_numeric_datetime(2000)).drop(columns="measurement_date")
+    with pytest.raises(RuntimeError):
+        run_compute_geodynamics_corrections(
+            np.zeros((3, 3)), PreciseDateTime.from_numeric_datetime(2000), pt_df, True, False
+        )
+
+
+def test_run_compute_geodynamics_corrections_outside_validity():
+    pt_df = _point_targets_df(PreciseDateTime.from_numeric_datetime(2000))
+    with pytest.raises(RuntimeError):
+        run_compute_geodynamics_corrections(
+            np.zeros((3, 3)), PreciseDateTime.from_numeric_datetime(2005), pt_df, True, False
+        )
+
+
+def test_run_compute_geodynamics_corrections_datetime_dates(mocker):
+    mock_compute = mocker.patch(
+        "sct.analyses.point_target.core.geodynamics_corrections_main.compute_geodynamics_corrections"
+    )
+    pt_df = pd.DataFrame(
+        {
+            "validity_start_date": pd.to_datetime(["1999-01-01"]),
+            "validity_stop_date": pd.to_datetime(["2001-01-01"]),
+            "measurement_date": pd.to_datetime(["2000-01-01T01:00:00"]),
+            "plate": ["EURA"],
+        }
+    )
+
+    run_compute_geodynamics_corrections(
+        np.zeros((1, 3)), PreciseDateTime.from_numeric_datetime(2000, hours=2), pt_df, True, False
+    )
+
+    assert mock_compute.call_args.kwargs["plate_tectonics_input"].time_delta_s == 3600
@@ -5,23 +5,25 @@
 
 import numpy as np
 import pandas as pd
+from perseo_core.geometry.coordinates import llh2xyz
 from perseo_core.timing import PreciseDateTime
+from perseo_quality.point_targets_analysis.rcs_geometric_computation import compute_elevation_azimuth_wrt_enu
 from scipy.constants import speed_of_light
 
-from sct.analyses.point_target.core.utilities import _compute_theoretical_rcs
+from sct.analyses.point_target.core.utilities import _compute_elevation_azimuth_wrt_enu, _compute_theoretical_rcs
 
 
 def test_compute_theoretical_rcs(mocker):
     """Test high level function"""
     mocker.patch(
-        "sct.analyses.point_target.core.utilities.compute_elevation_azimuth_wrt_enu",
-        return_value=(0, 0),
+        "sct.analyses.point_target.core.utilities._compute_elevation_azimuth_wrt_enu",
+        return_value=(np.zeros(1), np.zeros(1)),
     )
     carrier_frequency_hz = speed_of_light / 0.055
 
     class _TestTrajectory:
-        def position(self, _):
-            return None
+        def position(self, time):
+            return np.zeros((len(time), 3))
 
     columns_pt = [
         "target_name",
@@ -51,5 +53,85 @@ def test_compute_theoretical_rcs(mocker):
     columns = ["target_name", "peak_azimuth_time_[UTC]"]
     data_df = pd.DataFrame(data, columns=columns)
 
+    data_df_copy, point_targets_df_copy = data_df.copy(), point_targets_df.copy()
     results = _compute_theoretical_rcs(data_df, point_targets_df, carrier_frequency_hz, _TestTrajectory())
     np.testing.assert_allclose(results[0], 24.56450589612527, atol=1e-9, rtol=0)
+    # inputs are not altered
+    pd.testing.assert_frame_equal(data_df, data_df_copy)
+    pd.testing.assert_frame_equal(point_targets_df, point_targets_df_copy)
+
+
+def test_compute_theoretical_rcs_missing_peak_time():
+    """Results without a peak azimuth time have no theoretical RCS"""
+
+    class _TestTrajectory:
+        def position(self, _):
+            raise AssertionError("trajectory must not be evaluated")
+
+    point_targets_df = pd.DataFrame(
+        [["ExampleName", 0.7, 0, 0, 0, 0, 0]],
+        columns=[
+            "target_name",
+            "target_size_m",
+            "corner_elevation_deg",
+            "corner_azimuth_deg",
+            "x_coord_m",
+            "y_coord_m",
+            "z_coord_m",
+        ],
+    )
+    data_df = pd.DataFrame([["ExampleName", np.nan]], columns=["target_name", "peak_azimuth_time_[UTC]"])
+
+    results = _compute_theoretical_rcs(data_df, point_targets_df, speed_of_light / 0.055, _TestTrajectory())
+    assert len(results) == 1
+    assert np.isnan(results[0])
+
+
+def test_compute_elevation_azimuth_wrt_enu():
+    """Vectorized angles match the single target computation"""
+    pos_cr = llh2xyz(np.array([[np.deg2rad(45.0), np.deg2rad(9.0), 100.0], [np.deg2rad(-30.0), np.deg2rad(120.0), 0]]))
+    pos_sat = llh2xyz(np.array([[np.deg2rad(45.5), np.deg2rad(7.0), 7e5], [np.deg2rad(-31.0), np.deg2rad(122.0), 6e5]]))
+
+    elevation, azimuth = _compute_elevation_azimuth_wrt_enu(pos_cr=pos_cr, pos_sat=pos_sat)
+
+    for idx in range(2):
+        expected = compute_elevation_azimuth_wrt_enu(pos_cr=pos_cr[idx], pos_sat=pos_sat[idx])
+        np.testing.assert_allclose((elevation[idx], azimuth[idx]), expected, atol=1e-12, rtol=0)
+
+
+def test_compute_theoretical_rcs_shared_peak_times(mocker):
+    """Trajectory is evaluated once for results sharing the same peak azimuth time"""
+    mocker.patch(
+        "sct.analyses.point_target.core.utilities._compute_elevation_azimuth_wrt_enu",
+        side_effect=lambda pos_cr, pos_sat: (np.zeros(len(pos_cr)), np.zeros(len(pos_cr))),
+    )
+
+    class _TestTrajectory:
+        def __init__(self):
+            self.evaluated_times = []
+
+        def position(self, time):
+            self.evaluated_times.extend(time)
+            return np.zeros((len(time), 3))
+
+    point_targets_df = pd.DataFrame(
+        [["T1", 0.7, -9.7356, 0, 0, 0, 0], ["T2", 0.7, -9.7356, 0, 0, 0, 0]],
+        columns=[
+            "target_name",
+            "target_size_m",
+            "corner_elevation_deg",
+            "corner_azimuth_deg",
+            "x_coord_m",
+            "y_coord_m",
+            "z_coord_m",
+        ],
+    )
+    time = PreciseDateTime.from_numeric_datetime(2000)
+    data_df = pd.DataFrame(
+        [["T1", time], ["T2", time + 1], ["T1", time]], columns=["target_name", "peak_azimuth_time_[UTC]"]
+    )
+
+    trajectory = _TestTrajectory()
+    results = _compute_theoretical_rcs(data_df, point_targets_df, speed_of_light / 0.055, trajectory)
+    assert len(trajectory.evaluated_times) == 2
+    np.testing.assert_allclose(results, 24.5645, atol=1e-4, rtol=0)
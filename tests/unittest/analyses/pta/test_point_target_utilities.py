@@ -39,6 +39,37 @@ def test_update_df_with_llh():
     assert updated.loc[0, "latitude_deg"] == 45.0
 
 
+def test_update_df_with_llh_columns_order():
+    results = pd.DataFrame(
+        {
+            "target_name": ["T2", "T1", "T2"],
+            "acquisition_mode": ["SM", "SM", "SM"],
+            "some_result": [1.0, 2.0, 3.0],
+        }
+    )
+    point_targets_df = pd.DataFrame(
+        {
+            "target_name": ["T1", "T2"],
+            "latitude_deg": [45.0, 46.0],
+            "longitude_deg": [9.0, 10.0],
+            "altitude_m": [100.0, 200.0],
+            "target_type": ["CR", "CR"],
+        }
+    )
+
+    updated = update_df_with_llh(results, point_targets_df)
+    assert updated.columns.to_list() == [
+        "target_name",
+        "acquisition_mode",
+        "latitude_deg",
+        "longitude_deg",
+        "altitude_m",
+        "some_result",
+    ]
+    assert updated["altitude_m"].to_list() == [200.0, 100.0, 200.0]
+    assert updated["some_result"].to_list() == [1.0, 2.0, 3.0]
+
+
 def test_update_results_with_derived_quantities():
     results = pd.DataFrame(
         {
@@ -61,6 +92,21 @@ def test_update_results_with_derived_quantities():
     assert updated.loc[0, "revised_ale_azimuth_[m]"] == pytest.approx(3.5)
 
 
+def test_update_results_with_derived_quantities_missing_corrections():
+    results = pd.DataFrame(
+        {
+            "some_range_correction_[m]": [0.1, np.nan],
+            "slant_range_localization_error_[m]": [1.0, 2.0],
+            "azimuth_localization_error_[m]": [3.0, 4.0],
+        }
+    )
+
+    updated = update_results_with_derived_quantities(results)
+    np.testing.assert_allclose(updated["total_ale_range_correction_[m]"], [0.1, 0.0])
+    np.testing.assert_allclose(updated["total_ale_azimuth_correction_[m]"], [0.0, 0.0])
+    np.testing.assert_allclose(updated["revised_ale_azimuth_[m]"], [3.0, 4.0])
+
+
 def test_update_results_with_theoretical_rcs(monkeypatch):
     results = pd.DataFrame(
         {
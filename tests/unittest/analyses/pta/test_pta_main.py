@@ -0,0 +1,103 @@
+"""Testing point target analysis main functions"""
+
+from pathlib import Path
+from unittest import mock
+
+import pandas as pd
+from perseo_quality.core.generic_dataclasses import SARPolarization
+from perseo_quality.point_targets_analysis.custom_dataclasses import PointTargetGraphicalData
+
+from sct.analyses.point_target.main import _import_pta_graphs_func, _point_target_graphs_generation
+
+
+def _graphs_data() -> list[PointTargetGraphicalData]:
+    return [
+        PointTargetGraphicalData(target="T1", channel=1, swath="S1", burst=0, polarization=SARPolarization.HH),
+        PointTargetGraphicalData(target="T2", channel=1, swath="S1", burst=0, polarization=SARPolarization.HH),
+    ]
+
+
+def _stub_renderer(item: PointTargetGraphicalData, data_values: dict, output_dir: Path) -> str | None:
+    if item.target == "T2":
+        return "ValueError: error"
+    output_dir.joinpath(f"{item.target}.txt").write_text(str(data_values["rcs_[dB]"]))
+    return None
+
+
+def _serial_render_graphs(render_func, *iterables):
+    return list(map(render_func, *iterables))
+
+
+def _results_df() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "target_name": ["T1", "T2"],
+            "channel": [1, 1],
+            "burst": [0, 0],
+            "swath": ["S1", "S1"],
+            "polarization": ["H/H", "H/H"],
+            "rcs_[dB]": [30.0, 35.0],
+        }
+    )
+
+
+def test_import_pta_graphs_func():
+    assert _import_pta_graphs_func(graphs=False) is None
+    assert _import_pta_graphs_func(graphs=True) is _point_target_graphs_generation
+
+
+def test_point_target_graphs_generation(tmp_path):
+    graphs_module = "perseo_quality.point_targets_analysis.graphical_output"
+    with mock.patch("sct.analyses.point_target.main.render_graphs", _serial_render_graphs):
+        with mock.patch(f"{graphs_module}.irf_graphs") as mock_irf:
+            with mock.patch(f"{graphs_module}.rcs_graphs") as mock_rcs:
+                _point_target_graphs_generation(
+                    graphs_data=_graphs_data(), results_df=_results_df(), output_dir=tmp_path
+                )
+
+    assert mock_irf.call_count == 2
+    assert mock_rcs.call_count == 2
+    rcs_values = sorted(c.kwargs["data_values"]["rcs_[dB]"] for c in mock_irf.call_args_list)
+    assert rcs_values == [30.0, 35.0]
+
+
+def test_point_target_graphs_generation_rendering_error(tmp_path):
+    graphs_module = "perseo_quality.point_targets_analysis.graphical_output"
+    with mock.patch("sct.analyses.point_target.main.render_graphs", _serial_render_graphs):
+        with mock.patch(f"{graphs_module}.irf_graphs", side_effect=ValueError("error")):
+            with mock.patch(f"{graphs_module}.rcs_graphs") as mock_rcs:
+                with mock.patch("sct.analyses.point_target.main.sct_logger") as mock_logger:
+                    _point_target_graphs_generation(
+                        graphs_data=_graphs_data(), results_df=_results_df(), output_dir=tmp_path
+                    )
+
+    mock_rcs.assert_not_called()
+    assert mock_logger.warning.call_count == 2
+    assert "ValueError: error" in mock_logger.debug.call_args.args[0]
+
+
+def test_point_target_graphs_generation_missing_results(tmp_path):
+    graphs_module = "perseo_quality.point_targets_analysis.graphical_output"
+    results_df = _results_df().iloc[:1]
+    with mock.patch("sct.analyses.point_target.main.render_graphs", _serial_render_graphs):
+        with mock.patch(f"{graphs_module}.irf_graphs") as mock_irf:
+            with mock.patch(f"{graphs_module}.rcs_graphs"):
+                with mock.patch("sct.analyses.point_target.main.sct_logger") as mock_logger:
+                    _point_target_graphs_generation(
+                        graphs_data=_graphs_data(), results_df=results_df, output_dir=tmp_path
+                    )
+
+    mock_irf.assert_called_once()
+    assert mock_irf.call_args.kwargs["data_values"]["target_name"] == "T1"
+    mock_logger.warning.assert_called_once()
+
+
+def test_point_target_graphs_generation_process_pool(tmp_path):
+    with mock.patch("sct.analyses.point_target.main._render_point_target_graphs", _stub_renderer):
+        with mock.patch("sct.analyses.point_target.main.sct_logger") as mock_logger:
+            _point_target_graphs_generation(graphs_data=_graphs_data(), results_df=_results_df(), output_dir=tmp_path)
+
+    assert tmp_path.joinpath("T1.txt").read_text() == "30.0"
+    assert not tmp_path.joinpath("T2.txt").exists()
+    mock_logger.warning.assert_called_once()
+    assert "target T2" in mock_logger.warning.call_args.args[0]
@@ -0,0 +1,194 @@
+"""Testing point target analysis testing utilities"""
+
+from pathlib import Path
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from sct.analyses.point_target.config import IonosphericCorrectionsConf, SCTPointTargetAnalysisConfig
+from sct.analyses.point_target.testing import (
+    AZ_TIME_VAR,
+    DEG_VAR_LIST,
+    LOC_VAR_LIST,
+    OTHER_VAR_LIST,
+    RCS_VAR_LIST,
+    SLR_VAR_LIST,
+    run_pta_api,
+    validate_pta_results,
+)
+from sct.testing.utilities.common import ReferenceOutput, TestOutput, TestParams
+
+
+def _pta_results_df() -> pd.DataFrame:
+    numeric_columns = LOC_VAR_LIST + DEG_VAR_LIST + SLR_VAR_LIST + RCS_VAR_LIST + OTHER_VAR_LIST
+    data = {name: np.linspace(1.0, 3.0, 3) for name in numeric_columns}
+    data["incidence_angle_[deg]"] = [30.0, np.nan, 35.0]
+    data["target_name"] = ["T1", "T2", "T3"]
+    data["swath"] = ["S1", "S1", "S2"]
+    data[AZ_TIME_VAR[0]] = ["2020-01-01T00:00:00", "2020-01-01T00:00:01", "2020-01-01T00:00:02"]
+    return pd.DataFrame(data)
+
+
+def _save(df: pd.DataFrame, path):
+    df.to_csv(path, index=False)
+    return path
+
+
+def test_validate_pta_results_pass(tmp_path):
+    ref = _pta_results_df()
+    current = ref.copy()
+    current["rcs_[dB]"] += 0.05
+    current[AZ_TIME_VAR[0]] = "2021-01-01T00:00:00"
+
+    validate_pta_results(
+        current_output=TestOutput(csv_results=_save(current, tmp_path / "current.csv")),
+        reference_output=ReferenceOutput(csv_reference=_save(ref, tmp_path / "ref.csv")),
+    )
+
+
+def test_validate_pta_results_ignores_invalid_rows(tmp_path):
+    ref = _pta_results_df()
+    current = ref.copy()
+    current.loc[1, "range_resolution_[m]"] = 100.0
+
+    validate_pta_results(
+        current_output=TestOutput(csv_results=_save(current, tmp_path / "current.csv")),
+        reference_output=ReferenceOutput(csv_reference=_save(ref, tmp_path / "ref.csv")),
+    )
+
+
+def test_validate_pta_results_out_of_tolerance(tmp_path):
+    ref = _pta_results_df()
+    current = ref.copy()
+    current["range_resolution_[m]"] += 1e-3
+
+    with pytest.raises(AssertionError, match="range_resolution"):
+        validate_pta_results(
+            current_output=TestOutput(csv_results=_save(current, tmp_path / "current.csv")),
+            reference_output=ReferenceOutput(csv_reference=_save(ref, tmp_path / "ref.csv")),
+        )
+
+
+def test_validate_pta_results_other_columns_mismatch(tmp_path):
+    ref = _pta_results_df()
+    current = ref.copy()
+    current.loc[2, "swath"] = "S3"
+
+    with pytest.raises(AssertionError):
+        validate_pta_results(
+            current_output=TestOutput(csv_results=_save(current, tmp_path / "current.csv")),
+            reference_output=ReferenceOutput(csv_reference=_save(ref, tmp_path / "ref.csv")),
+        )
+
+
+def test_validate_pta_results_in_memory(tmp_path):
+    ref = _pta_results_df()
+    ref["target_name"] = [1, 2, 3]
+    current = ref.copy()
+    current["target_name"] = ["1", "2", "3"]
+    current_csv = _save(current, tmp_path / "current.csv")
+    current[AZ_TIME_VAR[0]] = [object(), object(), object()]
+
+    validate_pta_results(
+        current_output=TestOutput(csv_results=current_csv, dataframe_results=current),
+        reference_output=ReferenceOutput(csv_reference=_save(ref, tmp_path / "ref.csv")),
+    )
+
+
+def test_validate_pta_results_object_columns(tmp_path):
+    ref = _pta_results_df()
+    current = ref.copy()
+    current["scr_[dB]"] = current["scr_[dB]"].astype(object)
+
+    validate_pta_results(
+        current_output=TestOutput(dataframe_results=current),
+        reference_output=ReferenceOutput(csv_reference=_save(ref, tmp_path / "ref.csv")),
+    )
+
+
+def test_validate_pta_results_in_memory_written_file_mismatch(tmp_path):
+    ref = _pta_results_df()
+    current = ref.copy()
+    current_csv = _save(current.iloc[:2], tmp_path / "current.csv")
+
+    with pytest.raises(AssertionError, match="has 2 rows, 3 expected"):
+        validate_pta_results(
+            current_output=TestOutput(csv_results=current_csv, dataframe_results=current),
+            reference_output=ReferenceOutput(csv_reference=_save(ref, tmp_path / "ref.csv")),
+        )
+
+    _save(current.drop(columns="swath"), current_csv)
+    with pytest.raises(AssertionError, match="header does not match"):
+        validate_pta_results(
+            current_output=TestOutput(csv_results=current_csv, dataframe_results=current),
+            reference_output=ReferenceOutput(csv_reference=_save(ref, tmp_path / "ref.csv")),
+        )
+
+
+def test_validate_pta_results_in_memory_incompatible_types(tmp_path):
+    ref = _pta_results_df()
+    ref["clutter_[dB]"] = np.nan
+    current = ref.copy()
+    current["clutter_[dB]"] = ["a", "b", "c"]
+
+    with pytest.raises(AssertionError, match="Column clutter_\\[dB\\] cannot be compared"):
+        validate_pta_results(
+            current_output=TestOutput(dataframe_results=current),
+            reference_output=ReferenceOutput(csv_reference=_save(ref, tmp_path / "ref.csv")),
+        )
+
+
+def test_run_pta_api_does_not_modify_config(tmp_path):
+    config = SCTPointTargetAnalysisConfig()
+    params = TestParams(product=Path("product"), targets=Path("targets.csv"), tropospheric_maps=Path("tropo"))
+
+    with mock.patch(
+        "sct.analyses.point_target.main.point_target_analysis_with_results", return_value=(Path("out.csv"), None)
+    ) as mock_run:
+        run_pta_api(params=params, output_dir=tmp_path, config=config, graphs=False)
+
+    used_config = mock_run.call_args.kwargs["config"]
+    assert used_config.corrections.enable_tropospheric_correction
+    assert used_config.corrections.troposphere.maps_directory == Path("tropo")
+    assert not config.corrections.enable_tropospheric_correction
+    assert config.corrections.troposphere is None
+
+
+def test_run_pta_api_ionospheric_maps(tmp_path):
+    config = SCTPointTargetAnalysisConfig.from_dict(
+        {
+            "corrections": {
+                "ionosphere": {
+                    "maps_directory": "maps",
+                    "analysis_center": "jpl",
+                    "tec_incidence_angle_method": "ipp",
+                }
+            }
+        }
+    )
+    params = TestParams(product=Path("product"), targets=Path("targets.csv"), ionospheric_maps=Path("iono"))
+
+    with mock.patch(
+        "sct.analyses.point_target.main.point_target_analysis_with_results", return_value=(Path("out.csv"), None)
+    ) as mock_run:
+        run_pta_api(params=params, output_dir=tmp_path, config=config, graphs=False)
+
+    used_config = mock_run.call_args.kwargs["config"]
+    assert used_config.corrections.enable_ionospheric_correction
+    # only the analysis center is kept from the input ionospheric configuration
+    assert used_config.corrections.ionosphere == IonosphericCorrectionsConf(
+        maps_directory=Path("iono"), analysis_center=config.corrections.ionosphere.analysis_center
+    )
+    assert used_config.corrections.ionosphere.tec_incidence_angle_method.name == "GROUND_CONVERTED"
+
+
+def test_validate_pta_results_identical(tmp_path):
+    ref = _save(_pta_results_df(), tmp_path / "ref.csv")
+
+    with mock.patch("sct.analyses.point_target.testing._assert_columns_close") as mock_assert:
+        validate_pta_results(
+            current_output=TestOutput(csv_results=ref), reference_output=ReferenceOutput(csv_reference=ref)
+        )
+    mock_assert.assert_not_called()
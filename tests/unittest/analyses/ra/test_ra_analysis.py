@@ -0,0 +1,67 @@
+"""Testing radiometric analysis core functions"""
+
+from unittest import mock
+
+from sct.analyses.radiometry.config import SCTRadiometricAnalysisConfig
+from sct.analyses.radiometry.core.analysis import (
+    SupportedRadiometricProfiles,
+    sct_nesz_analysis,
+    sct_radiometric_profiles,
+)
+
+
+def test_sct_radiometric_profiles_loads_product():
+    product = mock.Mock()
+    with mock.patch(
+        "sct.analyses.radiometry.core.analysis.product_loader", return_value=(product, None)
+    ) as mock_loader:
+        with mock.patch.dict(
+            "sct.analyses.radiometry.core.analysis._RADIOMETRIC_PROFILES_DISPATCH",
+            {SupportedRadiometricProfiles.NESZ: mock.Mock()},
+        ) as dispatch:
+            mock_nesz = dispatch[SupportedRadiometricProfiles.NESZ]
+            sct_radiometric_profiles(
+                product_path="product", analysis_type=SupportedRadiometricProfiles.NESZ, config=mock.Mock()
+            )
+    mock_loader.assert_called_once()
+    assert mock_nesz.call_args.kwargs["product"] is product
+
+
+def test_sct_nesz_analysis_preloaded_product():
+    product = mock.Mock()
+    config = SCTRadiometricAnalysisConfig()
+    with mock.patch("sct.analyses.radiometry.core.analysis.product_loader") as mock_loader:
+        with mock.patch.dict(
+            "sct.analyses.radiometry.core.analysis._RADIOMETRIC_PROFILES_DISPATCH",
+            {SupportedRadiometricProfiles.NESZ: mock.Mock()},
+        ) as dispatch:
+            mock_nesz = dispatch[SupportedRadiometricProfiles.NESZ]
+            sct_nesz_analysis(product_path="product", config=config, product=product)
+    mock_loader.assert_not_called()
+    mock_nesz.assert_called_once_with(product=product, config=config.base_config)
+
+
+def test_sct_radiometric_profiles_dispatch():
+    product = mock.Mock()
+    config = mock.Mock()
+    module = "sct.analyses.radiometry.core.analysis"
+    mock_scalloping = mock.Mock()
+    with mock.patch.dict(
+        f"{module}._RADIOMETRIC_PROFILES_DISPATCH", {SupportedRadiometricProfiles.SCALLOPING: mock_scalloping}
+    ):
+        sct_radiometric_profiles(
+            product_path="product",
+            analysis_type=SupportedRadiometricProfiles.SCALLOPING,
+            config=config,
+            product=product,
+        )
+        with mock.patch(f"{module}.average_elevation_profiles") as mock_profiles:
+            sct_radiometric_profiles(
+                product_path="product",
+                analysis_type=SupportedRadiometricProfiles.PROFILES,
+                config=config,
+                output_quantity="quantity",
+                product=product,
+            )
+    mock_scalloping.assert_called_once_with(product=product, config=config)
+    mock_profiles.assert_called_once_with(product=product, output_quantity="quantity", config=config)
@@ -3,9 +3,13 @@
 
 """Testing SCT Radiometric Analysis CLI"""
 
+from typing import get_args
+
 from typer.testing import CliRunner
 
+from sct.analyses.radiometry.cli import RADIOMETRIC_QUANTITIES
 from sct.analyses.radiometry.config import SCTRadiometricAnalysisConfig
+from sct.cli import common
 from sct.cli.cli import app
 
 cli_runner = CliRunner()
@@ -19,6 +23,12 @@ def test_help_on_no_args():
     assert result.exit_code == 2
 
 
+def test_radiometric_quantities_options():
+    """Every radiometric quantity command line option is mapped to a radiometric quantity"""
+    options = get_args(get_args(common.RadiometricQuantityOption)[0])
+    assert set(options) == RADIOMETRIC_QUANTITIES.keys()
+
+
 def test_display_help():
     """Display help"""
     result = cli_runner.invoke(app, [command, "--help"])
@@ -0,0 +1,80 @@
+"""Testing radiometric analysis main functions"""
+
+from contextlib import nullcontext
+from unittest import mock
+
+import pytest
+
+from sct.analyses.radiometry.main import _prefetch_product_and_graphs_func, _ra_save_and_plot_results
+
+
+def _rendering_outcomes_with_error():
+    yield None
+    raise ValueError("rendering error")
+
+
+def test_ra_save_and_plot_results(tmp_path):
+    output = [mock.Mock(), mock.Mock()]
+    for channel, item in enumerate(output):
+        item.general_info.channel = channel
+    graphs_func = mock.Mock()
+    module = "sct.analyses.radiometry.main"
+
+    def serial_rendering_graphs(render_func, *iterables):
+        return nullcontext(list(map(render_func, *iterables)))
+
+    with mock.patch(f"{module}.rendering_graphs", side_effect=serial_rendering_graphs):
+        with mock.patch(f"{module}.radiometric_statistical_analysis_to_df") as mock_stats:
+            with mock.patch(f"{module}.radiometric_profiles_to_netcdf", return_value="file.nc") as mock_netcdf:
+                netcdf_file, kpi_file = _ra_save_and_plot_results(
+                    output=output, output_directory=tmp_path, graphs_func=graphs_func, tag="nesz", plot_mode="min"
+                )
+
+    assert netcdf_file == "file.nc"
+    assert kpi_file == tmp_path.joinpath("radiometry_statistics.csv")
+    mock_stats.return_value.to_csv.assert_called_once_with(kpi_file, index=False)
+    mock_netcdf.assert_called_once_with(data=output, out_path=tmp_path, tag="nesz")
+    assert graphs_func.call_count == 2
+    titles = sorted(c.kwargs["title"] for c in graphs_func.call_args_list)
+    assert titles == ["NESZ Profiles 0", "NESZ Profiles 1"]
+
+
+def test_ra_save_and_plot_results_no_graphs(tmp_path):
+    output = [mock.Mock()]
+    module = "sct.analyses.radiometry.main"
+    with mock.patch(f"{module}.rendering_graphs") as mock_rendering:
+        with mock.patch(f"{module}.radiometric_statistical_analysis_to_df"):
+            with mock.patch(f"{module}.radiometric_profiles_to_netcdf", return_value="file.nc"):
+                netcdf_file, _ = _ra_save_and_plot_results(
+                    output=output, output_directory=tmp_path, graphs_func=None, tag="nesz", plot_mode="min"
+                )
+
+    assert netcdf_file == "file.nc"
+    mock_rendering.assert_not_called()
+
+
+def test_prefetch_product_and_graphs_func(tmp_path):
+    product = mock.Mock()
+    graphs_func = mock.Mock()
+    module = "sct.analyses.radiometry.main"
+    with mock.patch(f"{module}.load_radiometric_product", return_value=product) as mock_loader:
+        with mock.patch(f"{module}._import_ra_graphs_func", return_value=graphs_func) as mock_import:
+            loaded_product, func = _prefetch_product_and_graphs_func(product=tmp_path, graphs=True)
+
+    assert loaded_product is product
+    assert func is graphs_func
+    mock_loader.assert_called_once_with(product_path=tmp_path)
+    mock_import.assert_called_once_with(True)
+
+
+def test_ra_save_and_plot_results_rendering_error(tmp_path):
+    output = [mock.Mock(), mock.Mock()]
+    module = "sct.analyses.radiometry.main"
+    with mock.patch(f"{module}.rendering_graphs", return_value=nullcontext(_rendering_outcomes_with_error())):
+        with mock.patch(f"{module}.radiometric_statistical_analysis_to_df"):
+            with mock.patch(f"{module}.radiometric_profiles_to_netcdf", return_value="file.nc") as mock_netcdf:
+                with pytest.raises(ValueError, match="rendering error"):
+                    _ra_save_and_plot_results(
+                        output=output, output_directory=tmp_path, graphs_func=mock.Mock(), tag="nesz", plot_mode="min"
+                    )
+    mock_netcdf.assert_called_once()
@@ -0,0 +1,37 @@
+"""Testing analyses graphs rendering utilities"""
+
+from itertools import repeat
+from unittest import mock
+
+import pytest
+
+from sct.analyses._graphs import render_graphs, rendering_graphs
+
+
+def _stub_renderer(value: int, scale: int) -> int:
+    if value < 0:
+        raise ValueError("negative value")
+    return value * scale
+
+
+def test_render_graphs_process_pool():
+    assert render_graphs(_stub_renderer, [1, 2, 3], repeat(10)) == [10, 20, 30]
+
+
+def test_render_graphs_error():
+    with pytest.raises(ValueError, match="negative value"):
+        render_graphs(_stub_renderer, [1, -1], repeat(10))
+
+
+def test_render_graphs_single_graph_inline():
+    with mock.patch("sct.analyses._graphs.ProcessPoolExecutor") as mock_executor:
+        assert render_graphs(_stub_renderer, [2], repeat(10)) == [20]
+        assert render_graphs(_stub_renderer, [], repeat(10)) == []
+    mock_executor.assert_not_called()
+
+
+def test_rendering_graphs_overlapping_work(tmp_path):
+    with rendering_graphs(_stub_renderer, [1, 2], repeat(10)) as outcomes:
+        tmp_path.joinpath("results.txt").write_text("results")
+    assert list(outcomes) == [10, 20]
+    assert tmp_path.joinpath("results.txt").exists()
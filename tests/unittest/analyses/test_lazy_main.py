@@ -0,0 +1,18 @@
+"""Testing analyses lazy main module import"""
+
+import pytest
+
+from sct.analyses import lazy_main_getattr
+
+
+def test_lazy_main_getattr_imports_main_on_access():
+    getattr_func = lazy_main_getattr("sct.analyses.spectra", ["full_spectral_analysis"])
+    from sct.analyses.spectra.main import full_spectral_analysis
+
+    assert getattr_func("full_spectral_analysis") is full_spectral_analysis
+
+
+def test_lazy_main_getattr_unknown_name():
+    getattr_func = lazy_main_getattr("sct.analyses.spectra", ["full_spectral_analysis"])
+    with pytest.raises(AttributeError, match="has no attribute 'missing'"):
+        getattr_func("missing")
@@ -8,8 +8,17 @@ from sct.cli.common import display_title, graceful_exit, log_elapsed_time, loggi
 
 def test_display_title():
     with mock.patch("typer.echo") as mock_echo:
-        display_title("SCT")
+        with mock.patch("sys.stdout.isatty", return_value=True):
+            display_title("SCT")
         assert mock_echo.call_count >= 2
+        assert mock_echo.call_args.args[0] != "SCT\n"
+
+
+def test_display_title_not_a_terminal():
+    with mock.patch("typer.echo") as mock_echo:
+        with mock.patch("sys.stdout.isatty", return_value=False):
+            display_title("SCT")
+    mock_echo.assert_called_with("SCT\n")
 
 
 def test_logging_to_file_no_path():
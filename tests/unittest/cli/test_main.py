@@ -3,6 +3,9 @@
 
 """SCT main function unit tests"""
 
+import subprocess
+import sys
+
 import pytest
 
 from sct import __main__ as main_module
@@ -18,3 +21,51 @@ def test_main(monkeypatch):
         assert system_exit.code == 2
     else:
         pytest.fail("SystemExit not raised")
+
+
+def test_main_logs_plugins_discovery():
+    """Logger must be configured before the CLI import, which runs the plugins discovery"""
+    result = subprocess.run([sys.executable, "-m", "sct", "--help"], capture_output=True, text=True, check=True)
+    assert "@ loader" in result.stdout
+    assert "Available plugins:" in result.stdout
+
+
+def test_cli_import_does_not_load_graphs_modules():
+    """Graphs modules must be imported lazily, only when graphs generation is requested"""
+    code = (
+        "import sys, sct.cli.cli; "
+        "assert not [m for m in sys.modules if m.startswith('matplotlib') or m.endswith('graphical_output')]"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_cli_import_does_not_load_art():
+    """Ascii art fonts must be imported lazily, only when a title is displayed"""
+    code = "import sys, sct.cli.cli; assert 'art' not in sys.modules"
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_cli_import_does_not_load_radiometry_implementation():
+    """Radiometric analysis implementation must be imported only when an analysis is run"""
+    code = (
+        "import sys, sct.cli.cli; "
+        "assert 'sct.analyses.radiometry.main' not in sys.modules; "
+        "from sct.analyses.radiometry import full_nesz_analysis; "
+        "assert 'sct.analyses.radiometry.main' in sys.modules"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_cli_import_does_not_load_analyses_implementations():
+    """Analyses implementations must be imported only when the corresponding analysis is run"""
+    code = (
+        "import sys, sct.cli.cli; "
+        "assert not [m for m in sys.modules if m.startswith('sct.analyses.') and m.endswith('.main')]"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_cli_import_does_not_load_atmospheric_perturbations():
+    """Atmospheric perturbations must be imported only when corrections are configured or downloaded"""
+    code = "import sys, sct.cli.cli; assert 'perseo_perturbations.atmospheric.ionosphere' not in sys.modules"
+    subprocess.run([sys.executable, "-c", code], check=True)
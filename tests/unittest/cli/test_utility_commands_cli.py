@@ -3,11 +3,14 @@
 
 """SCT Auxiliary Utilities Command Line Interface unit tests"""
 
+from datetime import datetime
 from pathlib import Path
+from unittest import mock
 
+from perseo_core.timing import PreciseDateTime
 from typer.testing import CliRunner
 
-from sct.cli.utilities import utilities_app
+from sct.cli.utilities import _to_precise_date_time, utilities_app
 
 cli_runner = CliRunner()
 
@@ -37,6 +40,30 @@ def test_download_ionex_error_non_existing_email(tmp_path):
     assert result.exit_code == 1
 
 
+def test_iono_downloader_wrong_analysis_center(tmp_path):
+    """Aborting on unknown analysis center, before any download"""
+    command = ["iono-downloader", "-d", "2024-04-20 10:00:00"]
+    command.extend(f"-c XYZ -e name@domain.it -out {tmp_path}".split())
+    with mock.patch("sct.web_scraping.ionosphere_tec_map_downloader.download_ionospheric_tec_maps") as mock_download:
+        result = cli_runner.invoke(utilities_app, command)
+    assert result.exit_code == 1
+    assert "Wrong center name" in result.stdout
+    assert not isinstance(result.exception, AttributeError)
+    mock_download.assert_not_called()
+
+
+def test_tropo_downloader_wrong_resolution(tmp_path):
+    """Aborting on unknown grid resolution, before any download"""
+    command = ["tropo-downloader", "-d", "2024-04-20 10:00:00"]
+    command.extend(f"-r ULTRA -out {tmp_path}".split())
+    with mock.patch("sct.web_scraping.troposphere_maps_downloader.download_tropospheric_products") as mock_download:
+        result = cli_runner.invoke(utilities_app, command)
+    assert result.exit_code == 1
+    assert "Wrong grid resolution" in result.stdout
+    assert not isinstance(result.exception, AttributeError)
+    mock_download.assert_not_called()
+
+
 def test_rosamond_converter(tmp_path):
     rosamond_out_1 = """"Corner ID","Latitude (deg)","Longitude (deg)","Height Above Ellipsoid (m)","""
     rosamond_out_2 = """"Azimuth (deg)","Tilt / Elevation angle (deg)","Side Length (m)","""
@@ -50,3 +77,9 @@ def test_rosamond_converter(tmp_path):
     result = cli_runner.invoke(utilities_app, command)
     assert result.exit_code == 0
     assert tmp_path.joinpath("rosamond_point_target.csv")
+
+
+def test_to_precise_date_time():
+    """Command line dates are converted to PreciseDateTime at seconds precision"""
+    date = _to_precise_date_time(datetime(2024, 4, 20, 10, 30, 15, 500))
+    assert date == PreciseDateTime.from_numeric_datetime(2024, 4, 20, 10, 30, 15)
@@ -1,7 +1,8 @@
 """Testing configuration/config_abc.py"""
 
+import tomllib
+
 import pytest
-import toml
 
 from sct.analyses.spectra.config import SCTSpectralAnalysisConfig
 from sct.configuration.common import InvalidConfigurationFile
@@ -22,7 +23,7 @@ def test_from_toml_wrong_extension(tmp_path):
 def test_from_toml_invalid_toml_content(tmp_path):
     invalid_file = tmp_path / "config.toml"
     invalid_file.write_text("not valid toml {{")
-    with pytest.raises(toml.TomlDecodeError):
+    with pytest.raises(tomllib.TOMLDecodeError):
         SCTSpectralAnalysisConfig.from_toml(invalid_file)
 
 
@@ -31,5 +32,5 @@ def test_to_toml(tmp_path):
     out_file = tmp_path / "dump.toml"
     config.to_toml(out_file)
     assert out_file.exists()
-    content = toml.load(out_file)
+    content = tomllib.loads(out_file.read_text(encoding="UTF-8"))
     assert "spectral_analysis" in content
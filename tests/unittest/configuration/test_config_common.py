@@ -1,9 +1,18 @@
 """Testing configuration/common.py"""
 
+import os
+from unittest import mock
+
 import pytest
 from jsonschema.exceptions import ValidationError
 
-from sct.configuration.common import toml_schema_validation
+from sct.configuration.common import (
+    _read_toml_configuration,
+    dataclass_field_names,
+    read_toml_configuration,
+    toml_schema_validation,
+)
+from sct.configuration.config import GeneralConfiguration
 from sct.resources import config_schema
 
 
@@ -18,6 +27,12 @@ def test_toml_schema_validation_invalid():
         toml_schema_validation(content=invalid_content, schema_path=config_schema)
 
 
+def test_toml_schema_validation_skipped(monkeypatch):
+    monkeypatch.setenv("SCT_SKIP_CONFIG_VALIDATION", "1")
+    invalid_content = {"general": {"save_log": "not_a_bool"}}
+    toml_schema_validation(content=invalid_content, schema_path=config_schema)
+
+
 def test_toml_schema_validation_invalid_schema_path():
     with pytest.raises(AssertionError):
         toml_schema_validation(content={}, schema_path="not_a_json")
@@ -26,3 +41,53 @@ def test_toml_schema_validation_invalid_schema_path():
 def test_toml_schema_validation_missing_schema_file():
     with pytest.raises(FileNotFoundError):
         toml_schema_validation(content={}, schema_path="missing.json")
+
+
+def test_toml_schema_validation_schema_loaded_once():
+    from sct.configuration.common import _load_schema_validator
+
+    _load_schema_validator.cache_clear()
+    toml_schema_validation(content={"general": {"save_log": True}}, schema_path=config_schema)
+    toml_schema_validation(content={"general": {"save_log": False}}, schema_path=str(config_schema))
+    assert _load_schema_validator.cache_info().misses == 1
+    assert _load_schema_validator.cache_info().hits == 1
+
+
+def test_read_toml_configuration_cached(tmp_path):
+    _read_toml_configuration.cache_clear()
+    config_file = tmp_path / "config.toml"
+    config_file.write_text("[general]\nsave_log = true\n")
+    with mock.patch("sct.configuration.common.toml_schema_validation") as mock_validation:
+        first = read_toml_configuration(file=config_file, schema_path=config_schema)
+        first["general"]["save_log"] = False
+        second = read_toml_configuration(file=config_file, schema_path=config_schema)
+    assert second == {"general": {"save_log": True}}
+    mock_validation.assert_called_once()
+
+
+def test_read_toml_configuration_file_changed(tmp_path):
+    _read_toml_configuration.cache_clear()
+    config_file = tmp_path / "config.toml"
+    config_file.write_text("[general]\nsave_log = true\n")
+    read_toml_configuration(file=config_file, schema_path=config_schema)
+    config_file.write_text("[general]\nsave_log = false\n")
+    stat = config_file.stat()
+    os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert read_toml_configuration(file=config_file, schema_path=config_schema) == {"general": {"save_log": False}}
+
+
+def test_read_toml_configuration_validated_when_enabled_again(tmp_path, monkeypatch):
+    _read_toml_configuration.cache_clear()
+    config_file = tmp_path / "config.toml"
+    config_file.write_text('[general]\nsave_log = "not_a_bool"\n')
+    monkeypatch.setenv("SCT_SKIP_CONFIG_VALIDATION", "1")
+    read_toml_configuration(file=config_file, schema_path=config_schema)
+    monkeypatch.delenv("SCT_SKIP_CONFIG_VALIDATION")
+    with pytest.raises(ValidationError):
+        read_toml_configuration(file=config_file, schema_path=config_schema)
+
+
+def test_dataclass_field_names():
+    names = dataclass_field_names(GeneralConfiguration)
+    assert names == frozenset(("save_log", "save_config_copy", "toml_path"))
+    assert dataclass_field_names(GeneralConfiguration) is names
@@ -1,6 +1,7 @@
 """Testing IO manager"""
 
 from pathlib import Path
+from unittest import mock
 
 import pytest
 
@@ -15,3 +16,17 @@ def test_product_loader_invalid_product():
 def test_product_loader_non_existent_path():
     with pytest.raises(InvalidProductType):
         product_loader(Path("C:/does_not_exist.safe"))
+
+
+def test_product_loader_plugin_detected_at_each_load(tmp_path):
+    plugin = mock.Mock(__name__="plugin")
+    plugin.get_manager.return_value.__name__ = "manager"
+    product_path = tmp_path / "product"
+    with mock.patch("sct.io.io_manager.available_plugins", [plugin]):
+        for _ in range(2):
+            product, ale_corr = product_loader(product_path)
+
+    assert plugin.get_detector.return_value.call_args_list == [mock.call(product_path)] * 2
+    assert plugin.get_manager.return_value.call_count == 2
+    assert product is plugin.get_manager.return_value.return_value
+    assert ale_corr is plugin.get_ale_corrector.return_value.return_value
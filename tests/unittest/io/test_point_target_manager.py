@@ -37,6 +37,21 @@ T1,45.0,9.0,100.0,CR,test,0.0,35.0,0.7,,,2025-06-01,0.0,0,0,0,0,NOAM,100.0,200.0
     assert len(df) == 1
 
 
+def test_read_csv_point_targets_file_cache(tmp_path):
+    csv_content = """target_name,measurement_date,validity_start_date,validity_stop_date
+T1,2024-06-01,2024-06-01,2025-06-01
+"""
+    csv_file = tmp_path / "targets.csv"
+    csv_file.write_text(csv_content)
+
+    df = read_csv_point_targets_file(csv_file)
+    df.loc[0, "target_name"] = "altered"
+    assert read_csv_point_targets_file(csv_file).loc[0, "target_name"] == "T1"
+
+    csv_file.write_text(csv_content + "T2,2024-06-01,2024-06-01,2025-06-01\n")
+    assert len(read_csv_point_targets_file(csv_file)) == 2
+
+
 def test_extract_point_target_data_from_source_missing(tmp_path):
     with pytest.raises(FileNotFoundError):
         extract_point_target_data_from_source(tmp_path / "nonexistent.csv")
@@ -29,6 +29,11 @@ def test_test_params_from_dict_analysis():
     assert params.product is None
 
 
+def test_test_params_from_dict_analysis_normalized():
+    params = TestParams.from_dict({"analysis": " RA-NESZ "})
+    assert params.analysis == "ra-nesz"
+
+
 def test_test_params_from_dict_product():
     params = TestParams.from_dict({"product": "/path/to/product.safe"})
     assert params.product == Path("/path/to/product.safe")
@@ -68,3 +73,12 @@ def test_cli_launcher_success():
         mock_runner.invoke.return_value.exit_code = 0
         cli_launcher(["--help"])
         mock_runner.invoke.assert_called_once()
+
+
+def test_test_params_from_dict_env_vars(monkeypatch):
+    monkeypatch.setenv("SCT_TEST_DATA", "/data")
+    params = TestParams.from_dict(
+        {"product": "$SCT_TEST_DATA/product.safe", "reference_output": "$SCT_TEST_DATA/ref.csv"}
+    )
+    assert params.product == Path("/data/product.safe")
+    assert params.reference_output.csv_reference == "/data/ref.csv"
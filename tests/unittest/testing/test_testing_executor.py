@@ -69,3 +69,15 @@ def test_execute_no_testing_handler():
     with mock.patch("sct.testing.utilities.executor.ANALYSIS_REGISTRY", registry):
         with pytest.raises(ValueError, match="Unsupported testing"):
             execute_analysis_test(params, Path("/tmp/out"))
+
+
+def test_execute_api_config_loaded_for_each_test():
+    handler = _make_handler()
+    registry = {"pta": handler}
+    params = mock.Mock(spec=TestParams, analysis="pta", config="shared_config.toml", reference_output=mock.Mock())
+
+    with mock.patch("sct.testing.utilities.executor.ANALYSIS_REGISTRY", registry):
+        with mock.patch("sct.testing.utilities.executor.sct_logger"):
+            execute_analysis_test(params, Path("/tmp/out"), graphs=False, cli=False)
+            execute_analysis_test(params, Path("/tmp/out"), graphs=False, cli=False)
+            assert handler.config.from_toml.call_args_list == [mock.call("shared_config.toml")] * 2
@@ -30,6 +30,7 @@ def test_summary_results_some_fail():
             outcome = summary_results(results)
             assert outcome is False
             mock_logger.fail.assert_any_call("INTEGRATION TESTS: FAIL")
+            mock_logger.critical.assert_any_call("FAILED tests: S1A/test2")
 
 
 def test_summary_results_print_fallback():
@@ -125,3 +126,50 @@ def test_run_tests_elapsed_minutes(tmp_path):
                 run_tests(registry_file, output_dir)
                 call_args = [c[0][0] for c in mock_logger.info.call_args_list if "minutes" in str(c)]
                 assert any("minutes" in str(a) for a in call_args)
+
+
+def test_run_tests_parallel(tmp_path):
+    import json
+    from concurrent.futures import ThreadPoolExecutor
+
+    from sct.testing.run import run_tests
+
+    registry_file = tmp_path / "registry.json"
+    registry_data = {
+        "S1A": {"test_a": {"analysis": "pta"}, "test_b": {"analysis": "interf"}},
+        "S2A": {"test_c": {"analysis": "pta"}},
+    }
+    registry_file.write_text(json.dumps(registry_data))
+    output_dir = tmp_path / "output"
+
+    def thread_pool(max_workers, mp_context, initializer):
+        assert mp_context.get_start_method() == "spawn"
+        return ThreadPoolExecutor(max_workers=max_workers)
+
+    with mock.patch("sct.testing.run.ProcessPoolExecutor", side_effect=thread_pool):
+        with mock.patch.dict("os.environ"):
+            with mock.patch("sct.testing.run.test_session", side_effect=[True, False, True]) as mock_ts:
+                with mock.patch("sct.testing.run.sct_logger"):
+                    results = run_tests(registry_file, output_dir, workers=2)
+                    assert results == {
+                        "S1A": {"test_a": True, "test_b": False},
+                        "S2A": {"test_c": True},
+                    }
+                    assert mock_ts.call_count == 3
+
+
+def test_limited_worker_threads_spawned_workers():
+    import multiprocessing
+    import os
+    from concurrent.futures import ProcessPoolExecutor
+
+    from sct.testing.run import WORKER_THREADS, _limited_worker_threads
+
+    with mock.patch.dict("os.environ", {"OMP_NUM_THREADS": "8"}):
+        os.environ.pop("OPENBLAS_NUM_THREADS", None)
+        with _limited_worker_threads():
+            with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn")) as executor:
+                worker_value = executor.submit(os.getenv, "OPENBLAS_NUM_THREADS").result()
+        assert worker_value == str(WORKER_THREADS)
+        assert os.environ["OMP_NUM_THREADS"] == "8"
+        assert "OPENBLAS_NUM_THREADS" not in os.environ
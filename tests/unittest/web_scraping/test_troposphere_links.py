@@ -1,9 +1,11 @@
 """Testing troposphere downloader helper functions"""
 
+from unittest import mock
+
 from perseo_core.timing import PreciseDateTime
 from perseo_perturbations.atmospheric.troposphere import TroposphericGRIDResolution
 
-from sct.web_scraping.troposphere_maps_downloader import _generate_download_link_vmf
+from sct.web_scraping.troposphere_maps_downloader import _generate_download_link_vmf, download_tropospheric_products
 
 
 def test_generate_download_link_vmf():
@@ -30,3 +32,19 @@ def test_generate_download_link_vmf_different_year():
     map_name = "VMF3_20230115.H00"
     result = _generate_download_link_vmf(acq_time, map_name)
     assert "2023" in result
+
+
+def test_download_tropospheric_products(tmp_path):
+    acq_time = PreciseDateTime.from_numeric_datetime(2024, 6, 1, 12, 0, 0)
+    map_names = [f"VMF3_20240601.H{hour:02d}" for hour in (6, 12, 18)]
+    with mock.patch(
+        "sct.web_scraping.troposphere_maps_downloader.generate_tropospheric_map_name_for_vmf_data",
+        return_value=(map_names, None),
+    ):
+        with mock.patch("requests.get", side_effect=lambda url, **_: mock.Mock(content=url.encode())) as mock_get:
+            out_files = download_tropospheric_products(acq_date=acq_time, output_dir=tmp_path)
+
+    assert out_files == [tmp_path.joinpath(name) for name in map_names]
+    assert mock_get.call_count == 3
+    for name, file in zip(map_names, out_files, strict=True):
+        assert file.read_text().endswith(name)